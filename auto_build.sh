@@ -12,7 +12,7 @@ STEP=0
 
 # Read step from tracker file if resuming
 if [ -f ".build_step" ]; then
-    STEP=$(cat .build_step)
+    STEP=$(head -n 1 .build_step)
 fi
 
 commit_step() {
@@ -0,0 +1,25 @@
+"""
+FriendZone Auto-Builder package.
+
+The core API (git helpers, write_file, run_step, backfill, ...) lives in
+``fzbuilder.core``. STEPS, MAINTENANCE_CYCLES and the tkinter window are
+resolved lazily, so ``import fzbuilder`` stays fast and works on servers
+without a display.
+"""
+
+from importlib import import_module
+
+_LAZY = {
+    "STEPS": "steps",
+    "MAINTENANCE_CYCLES": "steps",
+    "FriendZoneBuilder": "gui",
+    "main": "cli",
+}
+
+
+def __getattr__(name):
+    module = import_module("." + _LAZY.get(name, "core"), __name__)
+    try:
+        return getattr(module, name)
+    except AttributeError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
@@ -0,0 +1,570 @@
+"""
+FriendZone Auto-Builder asset stage: runs after each step from step_9 on
+(once index.html loads its modules) and turns the generated sources into
+what the page actually fetches.
+
+The ``<script>`` tags in index.html are replaced by one minified bundle and
+css/style.css by a deduplicated, minified copy that loads asynchronously
+behind an inlined critical subset. Both file names carry a content hash, so
+an unchanged asset stays cacheable across versions. ``asset-manifest.json``
+maps each asset to its current file and its sources. Once step_38 has
+written sw.js, it is regenerated from step_38's template with a precache
+list of the files the page and the builder's modules actually ship, each
+with its content hash. Everything goes through read_file/write_file,
+so the stage works in memory (dry runs, backfill) like the steps do.
+"""
+
+import hashlib
+import json
+import re
+
+from .core import list_files, read_file, remove_file, template, write_file
+
+BUNDLE_FROM_STEP = 9  # step_9 writes the index.html that loads every module
+MANIFEST = "asset-manifest.json"
+JS_BUNDLE = "js/bundle.js"
+STYLESHEET = "css/style.css"
+
+# Above-the-fold classes and ids (a name also covers ``name-*``): the navbar,
+# the feed and its post cards. Rules only about these are inlined.
+CRITICAL_NAMES = ("#app", "#main-content", ".navbar", ".logo", ".create-post", ".post",
+                  ".feed", ".btn")
+CRITICAL_TAGS = ("*", "html", "body")
+
+# A run of local module tags as the steps write them, or our bundle block.
+_SCRIPT_RUN = re.compile(
+    r'^([ \t]*)<script src="(js/[\w./-]+\.js)"></script>\n'
+    r'(?:[ \t]*<script src="js/[\w./-]+\.js"></script>\n)*', re.M)
+_STYLE_LINK = re.compile(r'^([ \t]*)<link rel="stylesheet" href="css/style\.css">\n', re.M)
+
+
+def _block_re(name):
+    return re.compile(rf'^([ \t]*)<!-- fz:begin {name} -->\n.*?<!-- fz:end {name} -->\n',
+                      re.M | re.S)
+
+
+_PRECACHE_BLOCK = re.compile(
+    r'^([ \t]*)// fz:begin precache\n.*?// fz:end precache\n', re.M | re.S)
+_SCRIPT_BLOCK = _block_re("scripts")
+_STYLE_BLOCK = _block_re("styles")
+
+# Words after which a "/" starts a regex literal rather than a division.
+_REGEX_AFTER_WORDS = {"return", "typeof", "case", "do", "else", "in", "of", "new",
+                      "delete", "void", "throw", "instanceof", "yield", "await"}
+
+
+def _is_word(c):
+    return c.isalnum() or c in "_$" or ord(c) > 127
+
+
+def _skip_string(src, i):
+    """Index just past the string or template literal starting at ``i``."""
+    quote, i = src[i], i + 1
+    while i < len(src):
+        c = src[i]
+        if c == "\\":
+            i += 2
+        elif c == quote:
+            return i + 1
+        elif quote == "`" and src.startswith("${", i):
+            i = _skip_braces(src, i + 2)
+        elif c == "\n" and quote != "`":
+            return i
+        else:
+            i += 1
+    return i
+
+
+def _skip_braces(src, i):
+    """Index just past the ``}`` closing a template ``${`` opened before ``i``."""
+    depth = 1
+    while i < len(src):
+        c = src[i]
+        if c in "\"'`":
+            i = _skip_string(src, i)
+            continue
+        if c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+            if not depth:
+                return i + 1
+        i += 1
+    return i
+
+
+def _skip_regex(src, i):
+    in_class, i = False, i + 1
+    while i < len(src) and src[i] != "\n":
+        c = src[i]
+        if c == "\\":
+            i += 1
+        elif c == "[":
+            in_class = True
+        elif c == "]":
+            in_class = False
+        elif c == "/" and not in_class:
+            return i + 1
+        i += 1
+    return i
+
+
+def minify_js(src):
+    """Strip comments, indentation and blank lines from ``src``.
+
+    Line breaks are kept (collapsed to one) so automatic semicolon insertion
+    behaves exactly as in the source; spaces survive only where two tokens
+    would otherwise merge.
+    """
+    out, pending, word, i, n = [], "", "", 0, len(src)
+    prev = ""  # last character emitted
+
+    def emit(text):
+        nonlocal pending, prev
+        if pending == "\n" and out:
+            out.append("\n")
+        elif pending == " " and prev and (
+                (_is_word(prev) and _is_word(text[0]))
+                or (prev == text[0] and prev in "+-/")
+                or (prev.isdigit() and text[0] == ".")):
+            out.append(" ")
+        out.append(text)
+        pending, prev = "", text[-1]
+
+    while i < n:
+        c = src[i]
+        if c in " \t\r\n":
+            if c == "\n" or pending != "\n":
+                pending = "\n" if c == "\n" else " "
+            i += 1
+        elif src.startswith("//", i):
+            i = src.find("\n", i)
+            i = n if i < 0 else i
+        elif src.startswith("/*", i):
+            end = src.find("*/", i + 2)
+            end = n if end < 0 else end + 2
+            if pending != "\n":
+                pending = "\n" if "\n" in src[i:end] else " "
+            i = end
+        elif c in "\"'`":
+            j = _skip_string(src, i)
+            emit(src[i:j])
+            word, i = "", j
+        elif c == "/" and not (prev in ")]" or (_is_word(prev) and word not in _REGEX_AFTER_WORDS)):
+            j = _skip_regex(src, i)
+            emit(src[i:j])
+            word, i = "", j
+        elif _is_word(c):
+            j = i
+            while j < n and _is_word(src[j]):
+                j += 1
+            word = src[i:j]
+            emit(word)
+            i = j
+        else:
+            emit(c)
+            word, i = "", i + 1
+    return "".join(out) + "\n"
+
+
+def content_hash(content):
+    """Short content hash used in asset file names."""
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()[:10]
+
+
+def hashed_name(logical, content):
+    stem, dot, ext = logical.rpartition(".")
+    return f"{stem}.{content_hash(content)}{dot}{ext}"
+
+
+def read_manifest():
+    text = read_file(MANIFEST)
+    return json.loads(text) if text else {}
+
+
+def write_manifest(manifest):
+    return write_file(MANIFEST, json.dumps(manifest, indent=2, sort_keys=True) + "\n")
+
+
+def replace_asset(manifest, logical, content, sources):
+    """Write ``content`` under its hashed name, drop the file it replaces and
+    record both in ``manifest``; returns the hashed name."""
+    name = hashed_name(logical, content)
+    old = manifest.get(logical, {}).get("file")
+    if old and old != name:
+        remove_file(old)
+    write_file(name, content)
+    manifest[logical] = {"file": name, "sources": sources}
+    return name
+
+
+def bundle_scripts(manifest, touched=None):
+    """Bundle the modules index.html loads and point it at the bundle.
+
+    Does nothing when ``touched`` (the paths the step changed) includes
+    neither index.html nor one of the bundled modules.
+    """
+    html = read_file("index.html")
+    if html is None:
+        return False
+    block = _SCRIPT_BLOCK.search(html)
+    if block:
+        sources = manifest.get(JS_BUNDLE, {}).get("sources")
+        if not sources or touched is not None and not set(touched) & set(sources):
+            return False
+    else:
+        # index.html as a step wrote it: bundle the modules its tags load.
+        block = _SCRIPT_RUN.search(html)
+        if not block:
+            return False
+        sources = re.findall(r'<script src="([^"]+)"', block.group(0))
+    # ";" between modules so a file without a trailing semicolon can't run
+    # into the next one.
+    bundle = ";\n".join(minify_js(read_file(path) or "") for path in sources)
+    name = replace_asset(manifest, JS_BUNDLE, bundle, sources)
+    write_file("index.html", _replace_block(html, block, "scripts",
+                                            [f'<script src="{name}"></script>']))
+    return True
+
+
+def _replace_block(html, match, name, lines):
+    """Replace ``match`` in ``html`` with ``lines`` between fz markers."""
+    indent = match.group(1)
+    body = "".join(f"{indent}{line}\n" for line in
+                   [f"<!-- fz:begin {name} -->"] + lines + [f"<!-- fz:end {name} -->"])
+    return html[:match.start()] + body + html[match.end():]
+
+
+# ── CSS ────────────────────────────────────────────────────────────────────
+# Parsed stylesheets are lists of nodes:
+#   ("rule", selector, [(property, value, important), ...])
+#   ("block", prelude, [nodes])   @media / @supports, whose body holds rules
+#   ("raw", text)                 any other at-rule, kept verbatim
+_CSS_STRING = r'"(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\''
+_CSS_COMMENT = re.compile(rf"({_CSS_STRING})|/\*.*?\*/", re.S)
+_NESTING_AT_RULES = ("@media", "@supports", "@layer", "@container")
+
+
+def _squeeze(text, punct=""):
+    """Collapse whitespace outside strings and drop it around ``punct``."""
+    parts = re.split(rf"({_CSS_STRING})", text)
+    for i in range(0, len(parts), 2):
+        part = re.sub(r"\s+", " ", parts[i])
+        if punct:
+            part = re.sub(rf"\s*([{re.escape(punct)}])\s*", r"\1", part)
+        parts[i] = part
+    return "".join(parts).strip()
+
+
+def _scan(text, i, stops):
+    """Index of the first of ``stops`` at or after ``i`` outside strings and
+    parentheses (``len(text)`` if none)."""
+    depth = 0
+    while i < len(text):
+        c = text[i]
+        if c in "\"'":
+            match = re.compile(_CSS_STRING).match(text, i)
+            i = match.end() if match else i + 1
+            continue
+        if c == "(":
+            depth += 1
+        elif c == ")":
+            depth = max(depth - 1, 0)
+        elif c in stops and not depth:
+            return i
+        i += 1
+    return i
+
+
+def _parse_declarations(text):
+    decls, i = [], 0
+    while i < len(text):
+        end = _scan(text, i, ";")
+        prop, colon, value = text[i:end].partition(":")
+        prop, value = prop.strip().lower(), _squeeze(value, ",")
+        if colon and prop and value:
+            important = value.lower().endswith("!important")
+            if important:
+                value = value[:-len("!important")].rstrip(" !")
+            decls.append((prop, value, important))
+        i = end + 1
+    return decls
+
+
+def parse_css(text, i=0):
+    """Parse ``text`` (comments already stripped) from ``i``; returns
+    ``(nodes, end)`` where ``end`` is just past the closing brace, if any."""
+    nodes = []
+    while True:
+        start = i
+        i = _scan(text, i, "{;}")
+        prelude = text[start:i].strip()
+        if i >= len(text) or text[i] == "}":
+            return nodes, i + 1
+        if text[i] == ";":
+            if prelude:
+                nodes.append(("raw", _squeeze(prelude) + ";"))
+            i += 1
+        elif prelude.startswith(_NESTING_AT_RULES):
+            children, i = parse_css(text, i + 1)
+            nodes.append(("block", _squeeze(prelude), children))
+        elif prelude.startswith("@"):
+            depth, j = 0, i
+            while j < len(text):
+                j = _scan(text, j, "{}")
+                if j < len(text):
+                    depth += 1 if text[j] == "{" else -1
+                j += 1
+                if not depth:
+                    break
+            nodes.append(("raw", _squeeze(text[start:j], "{};:,")))
+            i = j
+        else:
+            end = _scan(text, i + 1, "}")
+            nodes.append(("rule", _squeeze(prelude, ",>~+"),
+                          _parse_declarations(text[i + 1:end])))
+            i = end + 1
+
+
+def _properties(node):
+    if node[0] == "rule":
+        return {prop for prop, _, _ in node[2]}
+    if node[0] == "block":
+        return set().union(*map(_properties, node[2]))
+    return set()
+
+
+# Shorthands that set longhands not named after them (``margin`` covering
+# ``margin-top`` is caught by the name prefix).
+_LONGHANDS = {
+    "font": {"line-height"},
+    "gap": {"row-gap", "column-gap"},
+    "place-content": {"align-content", "justify-content"},
+    "place-items": {"align-items", "justify-items"},
+    "place-self": {"align-self", "justify-self"},
+    "grid-area": {"grid-row", "grid-row-start", "grid-row-end",
+                  "grid-column", "grid-column-start", "grid-column-end"},
+    "flex-flow": {"flex-direction", "flex-wrap"},
+    "columns": {"column-width", "column-count"},
+    "white-space": {"text-wrap-mode"},
+    "contain-intrinsic-size": {"contain-intrinsic-width", "contain-intrinsic-height"},
+}
+# Legacy names that are aliases of another property.
+_ALIASES = {"grid-gap": "gap", "grid-row-gap": "row-gap",
+            "grid-column-gap": "column-gap", "word-wrap": "overflow-wrap"}
+# Physical and flow-relative box properties set the same values under
+# different names (margin-left / margin-inline-start, top / inset-block-start),
+# so any two in one family are treated as overlapping.
+_BOX_FAMILIES = ("margin", "padding", "border", "scroll-margin", "scroll-padding", "inset")
+_INSET_SIDES = {"top", "right", "bottom", "left"}
+
+
+def _canonical(prop):
+    if prop.startswith("-") and not prop.startswith("--"):
+        prop = prop[prop.find("-", 1) + 1:]  # -webkit-appearance is appearance
+    return _ALIASES.get(prop, prop)
+
+
+def _family(prop):
+    if prop in _INSET_SIDES:
+        return "inset"
+    for base in _BOX_FAMILIES:
+        if prop == base or prop.startswith(base + "-"):
+            return base
+    return prop
+
+
+def _related(p, q):
+    p, q = _canonical(p), _canonical(q)
+    return (p == q or "all" in (p, q) or p.startswith(q + "-") or q.startswith(p + "-")
+            or q in _LONGHANDS.get(p, ()) or p in _LONGHANDS.get(q, ())
+            or _family(p) == _family(q))
+
+
+def _conflicts(a, b):
+    """Whether declarations of properties ``a`` and ``b`` can affect each
+    other: the same property, a shorthand and one of its longhands, aliases,
+    or two names for one box side. ``all`` covers everything."""
+    return any(_related(p, q) for p in a for q in b)
+
+
+def _dedupe(decls):
+    """Drop declarations repeated verbatim later in the same rule. Differing
+    values for one property are all kept; earlier ones may be fallbacks."""
+    last = {decl: i for i, decl in enumerate(decls)}
+    return [decl for i, decl in enumerate(decls) if last[decl] == i]
+
+
+def optimize_css(nodes):
+    """Merge rules with the same selector (in the same ``@media`` block)
+    where the cascade cannot tell the difference, and drop duplicates.
+
+    An earlier rule's declarations move into the later rule for its selector
+    when no rule in between touches the same properties; declarations the
+    later rule repeats verbatim are dropped regardless.
+    """
+    nodes = [("block", n[1], optimize_css(n[2])) if n[0] == "block" else n for n in nodes]
+    nodes = [("rule", n[1], _dedupe(n[2])) if n[0] == "rule" else n for n in nodes]
+    latest = {}
+    for j, node in enumerate(nodes):
+        if node[0] != "rule":
+            continue
+        k = latest.get(node[1])
+        latest[node[1]] = j
+        if k is None:
+            continue
+        earlier = [d for d in nodes[k][2] if d not in node[2]]
+        between = set().union(*map(_properties, nodes[k + 1:j]))
+        if not _conflicts({prop for prop, _, _ in earlier}, between):
+            node = nodes[j] = ("rule", node[1], _dedupe(earlier + node[2]))
+            earlier = []
+        nodes[k] = ("rule", node[1], earlier)
+    merged = []
+    for node in nodes:
+        if node[0] == "rule" and not node[2] or node[0] == "block" and not node[2]:
+            continue
+        if (node[0] == "block" and merged and merged[-1][0] == "block"
+                and merged[-1][1] == node[1]):
+            merged[-1] = ("block", node[1], optimize_css(merged[-1][2] + node[2]))
+            continue
+        merged.append(node)
+    return merged
+
+
+def serialize_css(nodes):
+    out = []
+    for node in nodes:
+        if node[0] == "rule":
+            body = ";".join(f"{p}:{v}{'!important' if imp else ''}" for p, v, imp in node[2])
+            out.append(f"{node[1]}{{{body}}}")
+        elif node[0] == "block":
+            out.append(f"{node[1]}{{{serialize_css(node[2])}}}")
+        else:
+            out.append(node[1].replace(";}", "}"))
+    return "".join(out)
+
+
+def minify_css(text):
+    """Deduplicated, merged and minified copy of stylesheet ``text``."""
+    nodes, _ = parse_css(_CSS_COMMENT.sub(lambda m: m.group(1) or " ", text))
+    return serialize_css(optimize_css(nodes))
+
+
+def _is_critical(selector):
+    for part in selector.split(","):
+        # Attribute values, pseudo-class arguments and pseudo-classes say
+        # nothing about where the element is.
+        part = re.sub(r"\[[^\]]*\]|\([^)]*\)|::?[\w-]+", "", part)
+        names = re.findall(r"[.#][\w-]+", part)
+        if names:
+            if all(any(n == c or n.startswith(c + "-") for c in CRITICAL_NAMES)
+                   for n in names):
+                return True
+        elif part.strip() in CRITICAL_TAGS:
+            return True
+    return False
+
+
+def critical_css(nodes):
+    """The rules of ``nodes`` that style above-the-fold content."""
+    out = []
+    for node in nodes:
+        if node[0] == "rule" and _is_critical(node[1]):
+            out.append(node)
+        elif node[0] == "block":
+            children = critical_css(node[2])
+            if children:
+                out.append(("block", node[1], children))
+    return out
+
+
+def build_styles(manifest, touched=None):
+    """Ship css/style.css as a minified, hashed stylesheet that loads
+    asynchronously, with its above-the-fold rules inlined in index.html.
+
+    Does nothing unless ``touched`` includes the stylesheet or index.html
+    lost its styles block.
+    """
+    html = read_file("index.html")
+    source = read_file(STYLESHEET)
+    if html is None or source is None:
+        return False
+    block = _STYLE_BLOCK.search(html)
+    if block:
+        if touched is not None and STYLESHEET not in touched:
+            return False
+    else:
+        block = _STYLE_LINK.search(html)
+        if not block:
+            return False
+    nodes, _ = parse_css(_CSS_COMMENT.sub(lambda m: m.group(1) or " ", source))
+    nodes = optimize_css(nodes)
+    name = replace_asset(manifest, STYLESHEET, serialize_css(nodes), [STYLESHEET])
+    # The full sheet repeats the inlined rules, so once it loads the cascade
+    # is exactly that of the source stylesheet.
+    write_file("index.html", _replace_block(html, block, "styles", [
+        f"<style>{serialize_css(critical_css(nodes))}</style>",
+        f'<link rel="preload" href="{name}" as="style" '
+        "onload=\"this.onload=null;this.rel='stylesheet'\">",
+        f'<noscript><link rel="stylesheet" href="{name}"></noscript>',
+    ]))
+    return True
+
+
+# ── Service worker precache ────────────────────────────────────────────────
+SERVICE_WORKER = "sw.js"
+PRECACHE_ROOT_FILES = ("index.html", "manifest.json")
+
+
+def _is_frontend(rel_path):
+    return (rel_path in PRECACHE_ROOT_FILES or rel_path == SERVICE_WORKER
+            or rel_path.startswith(("js/", "css/")))
+
+
+def precache_files(manifest):
+    """Paths the page can fetch: index.html, manifest.json, the hashed
+    assets and every JS module that is not folded into a bundle."""
+    bundled = {src for entry in manifest.values() for src in entry["sources"]}
+    files = [p for p in PRECACHE_ROOT_FILES if read_file(p) is not None]
+    files += sorted(entry["file"] for entry in manifest.values())
+    files += [f"js/{name}" for name in list_files("js")
+              if name.endswith(".js") and f"js/{name}" not in bundled
+              and f"js/{name}" not in files]
+    if STYLESHEET not in manifest and read_file(STYLESHEET) is not None:
+        files.append(STYLESHEET)
+    return files
+
+
+def build_precache(manifest, touched=None):
+    """Regenerate sw.js from step_38's template with a precache block of
+    one entry per shipped file and its content hash, so clients re-download
+    only what changed and older service workers pick up template changes.
+
+    Does nothing before step_38 or when ``touched`` has no front-end file.
+    """
+    if read_file(SERVICE_WORKER) is None:
+        return False
+    if touched is not None and not any(map(_is_frontend, touched)):
+        return False
+    sw = template("step_38/sw.js")
+    entries = [f'"/{path}": "{content_hash(read_file(path))}"'
+               for path in precache_files(manifest)]
+    block = _PRECACHE_BLOCK.search(sw)
+    indent = block.group(1)
+    lines = ["const PRECACHE = {"] + [f"    {e}," for e in entries[:-1]]
+    lines += [f"    {entries[-1]}", "};"] if entries else ["};"]
+    write_file(SERVICE_WORKER, sw[:block.start()]
+               + "".join(f"{indent}{line}\n" for line in
+                         ["// fz:begin precache"] + lines + ["// fz:end precache"])
+               + sw[block.end():])
+    return True
+
+
+def build_assets(touched):
+    """Asset stage for one step; ``touched`` lists the files it changed."""
+    manifest = read_manifest()
+    bundle_scripts(manifest, touched)
+    build_styles(manifest, touched)
+    build_precache(manifest, touched)
+    if manifest:
+        write_manifest(manifest)
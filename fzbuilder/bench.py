@@ -0,0 +1,176 @@
+"""
+FriendZone Auto-Builder benchmarks.
+
+Builds throwaway repositories under a temp directory and measures step
+rendering, maintenance-cycle cost, fast-import backfill and per-commit
+latency as the repository grows. The report is JSON so runs from different
+versions can be diffed:
+
+    python -m fzbuilder.bench --out bench_report.json
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from . import core
+
+
+def percentile(samples, pct):
+    """Nearest-rank percentile of ``samples`` (0 < pct <= 100)."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = max(math.ceil(pct / 100.0 * len(ordered)) - 1, 0)
+    return ordered[rank]
+
+
+def _fresh_repo(parent, name):
+    path = os.path.join(parent, name)
+    os.makedirs(path)
+    subprocess.run(["git", "init", "-q"], cwd=path, check=True)
+    subprocess.run(["git", "config", "user.name", "FriendZone Bench"], cwd=path, check=True)
+    subprocess.run(["git", "config", "user.email", "bench@friendzone.local"], cwd=path, check=True)
+    core.set_repo(path)
+    return path
+
+
+def _rate(count, secs):
+    return round(count / secs, 2) if secs else None
+
+
+def bench_render(tmp):
+    """Render every feature step into memory (no disk, no git)."""
+    _fresh_repo(tmp, "render")
+    count = core.step_count()
+    started = time.perf_counter()
+    core.render_range(0, count)
+    secs = time.perf_counter() - started
+    return {"steps": count, "secs": round(secs, 6), "steps_per_sec": _rate(count, secs)}
+
+
+def bench_commit_steps(tmp):
+    """Render and commit every feature step, one git commit per step."""
+    _fresh_repo(tmp, "commit")
+    count = core.step_count()
+    started = time.perf_counter()
+    for _ in range(count):
+        core.commit_step(log=lambda msg: None)
+    secs = time.perf_counter() - started
+    return {"steps": count, "secs": round(secs, 6), "steps_per_sec": _rate(count, secs)}
+
+
+def bench_maintenance(tmp, versions):
+    """Render ``versions`` maintenance cycles in memory after the feature steps."""
+    _fresh_repo(tmp, "maintenance")
+    count = core.step_count()
+    overlay, _ = core.render_range(0, count)
+    started = time.perf_counter()
+    core.render_range(count, versions, overlay=overlay)
+    secs = time.perf_counter() - started
+    sizes = {path: len(text.encode("utf-8")) for path, text in overlay.files.items()
+             if text is not None}
+    return {"versions": versions, "secs": round(secs, 6),
+            "versions_per_sec": _rate(versions, secs),
+            "ms_per_version": round(secs * 1000 / versions, 3) if versions else None,
+            "largest_files": dict(sorted(sizes.items(), key=lambda kv: -kv[1])[:5])}
+
+
+def bench_backfill(tmp, versions):
+    """Seed a repo with every feature step plus ``versions`` maintenance
+    versions through one fast-import stream."""
+    _fresh_repo(tmp, "backfill")
+    started = time.perf_counter()
+    commits = core.backfill(versions, log=lambda msg: None)
+    secs = time.perf_counter() - started
+    return {"commits": commits, "secs": round(secs, 6), "commits_per_sec": _rate(commits, secs)}
+
+
+def _repo_bytes(path):
+    total = 0
+    for root, _, files in os.walk(os.path.join(path, ".git")):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(root, name))
+            except OSError:
+                pass
+    return total
+
+
+def bench_commit_latency(tmp, commits, bucket):
+    """Time git_commit for ``commits`` consecutive steps and report p50/p99
+    latency per ``bucket`` commits, alongside the size of .git."""
+    path = _fresh_repo(tmp, "latency")
+    buckets, samples = [], []
+    for step_num in range(commits):
+        core.run_step(step_num)
+        started = time.perf_counter()
+        core.git_commit(f"bench step {step_num}")
+        samples.append((time.perf_counter() - started) * 1000)
+        if len(samples) == bucket or step_num == commits - 1:
+            buckets.append({"commits": step_num + 1, "git_dir_bytes": _repo_bytes(path),
+                            "p50_ms": round(percentile(samples, 50), 3),
+                            "p99_ms": round(percentile(samples, 99), 3),
+                            "max_ms": round(max(samples), 3)})
+            samples = []
+    return buckets
+
+
+def run(maintenance=1000, commits=300, bucket=50, log=print):
+    git_version = subprocess.run(["git", "--version"], capture_output=True,
+                                 text=True).stdout.strip()
+    report = {
+        "generated_at": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": platform.platform(),
+        "git": git_version,
+        "params": {"maintenance": maintenance, "commits": commits, "bucket": bucket},
+    }
+    previous_repo = core.REPO_DIR
+    with tempfile.TemporaryDirectory(prefix="fzbench-") as tmp:
+        try:
+            for name, fn, args in (
+                ("render_steps", bench_render, ()),
+                ("commit_steps", bench_commit_steps, ()),
+                ("maintenance", bench_maintenance, (maintenance,)),
+                ("backfill", bench_backfill, (maintenance,)),
+                ("commit_latency", bench_commit_latency, (commits, bucket)),
+            ):
+                log(f"running {name}...")
+                report[name] = fn(tmp, *args)
+        finally:
+            core.set_repo(previous_repo)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FriendZone Auto-Builder benchmarks")
+    parser.add_argument("--maintenance", type=int, default=1000, metavar="N",
+                        help="maintenance versions to render / backfill (default: %(default)s)")
+    parser.add_argument("--commits", type=int, default=300, metavar="N",
+                        help="commits in the latency run (default: %(default)s)")
+    parser.add_argument("--bucket", type=int, default=50, metavar="N",
+                        help="commits per latency bucket (default: %(default)s)")
+    parser.add_argument("--out", metavar="PATH",
+                        help="write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    report = run(args.maintenance, args.commits, args.bucket,
+                 log=lambda msg: print(msg, file=sys.stderr))
+    text = json.dumps(report, indent=2)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+FriendZone Auto-Builder command line: opens the GUI by default, or runs the
+headless backfill, dry-run and multi-repository modes.
+"""
+
+import argparse
+import threading
+import time
+from datetime import datetime
+
+from .core import (CATCH_UP_POLICIES, INTERVAL, Schedule, backfill, backfill_count,
+                   build_many, dry_run, wait_until, _parse_when)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FriendZone Auto-Builder")
+    parser.add_argument("--backfill", type=int, metavar="N",
+                        help="headless: commit the remaining steps plus N maintenance "
+                             "versions in one git fast-import pass, then exit")
+    parser.add_argument("--start", type=_parse_when, metavar="WHEN",
+                        help="date of the first backfilled commit (epoch or ISO-8601)")
+    parser.add_argument("--spacing", type=int, default=INTERVAL, metavar="SECS",
+                        help="seconds between backfilled commit dates (default: %(default)s)")
+    parser.add_argument("--repos", nargs="+", metavar="DIR",
+                        help="headless: drive these target repositories in parallel "
+                             "instead of the one next to this script")
+    parser.add_argument("--steps", type=int, default=1, metavar="N",
+                        help="with --repos: steps to commit per repository (default: 1)")
+    parser.add_argument("--workers", type=int, metavar="N",
+                        help="with --repos: worker processes (default: one per core)")
+    parser.add_argument("--schedule", metavar="SPEC",
+                        help="with --repos: keep running on this schedule (minutes or cron)")
+    parser.add_argument("--group", action="store_true",
+                        help="with --repos: commit the --steps of each repository as one commit")
+    parser.add_argument("--catch-up", choices=CATCH_UP_POLICIES, default="skip",
+                        help="with --schedule: what to do with runs missed while the "
+                             "controller was down (default: %(default)s)")
+    parser.add_argument("--backdate", action="store_true",
+                        help="with --catch-up: date catch-up commits at the missed run times")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="render in memory and print the byte delta per file "
+                             "(the next step, or the --backfill range) without writing")
+    args = parser.parse_args(argv)
+    if args.repos and args.dry_run:
+        parser.error("--dry-run cannot be combined with --repos")
+
+    if args.repos:
+        try:
+            schedule = Schedule.parse(args.schedule) if args.schedule else None
+        except ValueError as exc:
+            parser.error(f"--schedule: {exc}")
+        stop = threading.Event()
+        catch_up_policy = args.catch_up
+        try:
+            while True:
+                build_many(args.repos, steps=args.steps, workers=args.workers,
+                           backfill_versions=args.backfill, group=args.group,
+                           schedule=schedule, catch_up_policy=catch_up_policy,
+                           backdate=args.backdate, start=args.start, spacing=args.spacing)
+                if schedule is None:
+                    return
+                catch_up_policy = None  # only runs missed before startup need catching up
+                next_run = schedule.next_after(time.time())
+                print(f"Next run at {datetime.fromtimestamp(next_run):%Y-%m-%d %H:%M}.")
+                wait_until(next_run, stop)
+        except KeyboardInterrupt:
+            return
+
+    if args.dry_run:
+        if args.backfill is None:
+            dry_run(1)
+        else:
+            dry_run(backfill_count(args.backfill))
+        return
+
+    if args.backfill is not None:
+        started = time.perf_counter()
+        n = backfill(args.backfill, start=args.start, spacing=args.spacing)
+        print(f"Backfilled {n} commits in {time.perf_counter() - started:.2f}s.")
+        return
+
+    # tkinter is only imported when the window is actually opened.
+    from .gui import FriendZoneBuilder
+
+    app = FriendZoneBuilder()
+    app.run()
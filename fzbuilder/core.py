@@ -0,0 +1,1047 @@
+"""
+FriendZone Auto-Builder core: git helpers, file rendering, the step tracker,
+scheduling and the headless (backfill / multi-repository) drivers.
+
+Importing this module is cheap: the step bodies in ``fzbuilder.steps`` are
+only loaded when a step is actually rendered.
+"""
+
+import hashlib
+import json
+import os
+import random
+import re
+import sys
+import subprocess
+import time
+from datetime import datetime, timedelta
+from importlib import resources
+
+from .gitrepo import GitRepo, Unsupported, discover
+
+# ── Resolve paths ──────────────────────────────────────────────────────────
+if getattr(sys, "frozen", False):
+    BASE_DIR = os.path.dirname(sys.executable)
+else:
+    BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+REPO_DIR = BASE_DIR
+STEP_FILE = os.path.join(REPO_DIR, ".build_step")
+JOURNAL_FILE = os.path.join(REPO_DIR, ".build_journal")
+CACHE_FILE = os.path.join(REPO_DIR, ".build_cache")
+METRICS_FILE = os.path.join(REPO_DIR, ".build_metrics.jsonl")
+INTERVAL = 3600  # 1 hour in seconds
+
+
+def set_repo(path):
+    """Point the builder at another target repository (per process)."""
+    global REPO_DIR, STEP_FILE, JOURNAL_FILE, CACHE_FILE, METRICS_FILE
+    global _hash_index, _hash_index_dirty, _git_repo
+    REPO_DIR = os.path.abspath(path)
+    STEP_FILE = os.path.join(REPO_DIR, ".build_step")
+    JOURNAL_FILE = os.path.join(REPO_DIR, ".build_journal")
+    CACHE_FILE = os.path.join(REPO_DIR, ".build_cache")
+    METRICS_FILE = os.path.join(REPO_DIR, ".build_metrics.jsonl")
+    _hash_index, _hash_index_dirty = None, False
+    if _git_repo:
+        _git_repo.close()
+    _git_repo = None
+
+
+# ── Metrics (.build_metrics.jsonl) ─────────────────────────────────────────
+# Counters for the step being measured; see reset_metrics / record_metrics.
+_metrics = {}
+
+
+def reset_metrics():
+    _metrics.clear()
+    _metrics.update(git_calls=0, git_secs=0.0, write_secs=0.0, bytes_written=0, files={})
+
+
+def _count_write(rel_path, nbytes, secs):
+    if _metrics:
+        _metrics["write_secs"] += secs
+        _metrics["bytes_written"] += nbytes
+        _metrics["files"][rel_path] = _metrics["files"].get(rel_path, 0) + nbytes
+
+
+def record_metrics(kind, **fields):
+    """Append one JSON record (the given fields plus the counters gathered
+    since reset_metrics) to METRICS_FILE."""
+    record = {"kind": kind, "at": datetime.now().isoformat(timespec="seconds")}
+    record.update(fields)
+    record.update(_metrics)
+    record["files_touched"] = len(_metrics.get("files", ()))
+    for key, value in record.items():
+        if isinstance(value, float):
+            record[key] = round(value, 6)
+    with open(METRICS_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+
+
+# ── Git helpers ────────────────────────────────────────────────────────────
+_git_repo = None  # GitRepo for REPO_DIR once opened, False if it can't be used
+
+
+def git_repo():
+    """The in-process GitRepo for REPO_DIR, opened once per session, or None
+    when the repository needs the git command line."""
+    global _git_repo
+    if _git_repo is None:
+        try:
+            _git_repo = GitRepo(REPO_DIR)
+        except Unsupported:
+            _git_repo = False
+    return _git_repo or None
+
+
+def git(*args, env=None):
+    started = time.perf_counter()
+    result = subprocess.run(
+        ["git"] + list(args),
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+        env=dict(os.environ, **env) if env else None,
+    )
+    if _metrics:
+        _metrics["git_calls"] += 1
+        _metrics["git_secs"] += time.perf_counter() - started
+    return result.returncode, result.stdout.strip(), result.stderr.strip()
+
+
+def git_date(ts):
+    """``ts`` (epoch seconds) in git's internal date format, local offset."""
+    return f"{int(ts)} {datetime.fromtimestamp(ts).astimezone():%z}"
+
+
+def git_commit(message, paths=None, author_date=None):
+    """Commit ``paths`` (default: the files the last step wrote) without
+    rescanning the rest of the working tree, optionally backdating the
+    author date to ``author_date`` (epoch seconds)."""
+    paths = list(_touched if paths is None else paths)
+    if not paths:
+        return False
+    repo = git_repo()
+    if repo is not None:
+        started = time.perf_counter()
+        try:
+            return repo.commit(message, paths, git_date(time.time()),
+                               git_date(author_date) if author_date else None) is not None
+        except Unsupported:
+            pass
+        finally:
+            if _metrics:
+                _metrics["git_secs"] += time.perf_counter() - started
+    git("add", "-A", "--", *paths)
+    env = {"GIT_AUTHOR_DATE": git_date(author_date)} if author_date else None
+    code, out, err = git("commit", "-m", message, "--", *paths, env=env)
+    return code == 0
+
+
+# ── In-memory overlay ──────────────────────────────────────────────────────
+class Overlay:
+    """Holds rendered files in memory so a run of steps can be previewed,
+    diffed against the working tree and then flushed with one write per file."""
+
+    def __init__(self):
+        self.files = {}
+
+    def read(self, rel_path):
+        if rel_path in self.files:
+            return self.files[rel_path]
+        return _read_disk(rel_path)
+
+    def write(self, rel_path, content):
+        if self.read(rel_path) == content:
+            return False
+        self.files[rel_path] = content
+        return True
+
+    def append(self, rel_path, content):
+        self.files[rel_path] = (self.read(rel_path) or "") + content
+        return bool(content)
+
+    def remove(self, rel_path):
+        if self.read(rel_path) is None:
+            return False
+        self.files[rel_path] = None
+        return True
+
+    def diff(self):
+        """Return ``(rel_path, old_bytes, new_bytes)`` for every file whose
+        rendered content differs from disk; ``old_bytes`` is None for new files
+        and ``new_bytes`` is None for removed ones."""
+        changes = []
+        for rel_path in sorted(self.files):
+            new = self.files[rel_path]
+            old = _read_disk(rel_path)
+            if new != old:
+                changes.append((rel_path,
+                                None if old is None else len(old.encode("utf-8")),
+                                None if new is None else len(new.encode("utf-8"))))
+        return changes
+
+    def flush(self):
+        """Write every changed file to disk once and return their paths."""
+        written = []
+        for rel_path, _, _ in self.diff():
+            if _write_disk(rel_path, self.files[rel_path]):
+                written.append(rel_path)
+        save_hash_index()
+        return written
+
+
+# Active overlay, if any; write_file/append_file render into it instead of disk.
+_overlay = None
+
+
+def _read_disk(rel_path):
+    try:
+        with open(os.path.join(REPO_DIR, rel_path), "r", encoding="utf-8") as f:
+            return f.read()
+    except FileNotFoundError:
+        return None
+
+
+# ── Content-hash index (.build_cache) ─────────────────────────────────────
+# rel_path -> [sha1 of content, size, mtime_ns] as of the builder's last write.
+_hash_index = None
+_hash_index_dirty = False
+
+
+def _load_hash_index():
+    global _hash_index
+    if _hash_index is None:
+        try:
+            with open(CACHE_FILE, encoding="utf-8") as f:
+                _hash_index = json.load(f)
+        except (OSError, ValueError):
+            _hash_index = {}
+    return _hash_index
+
+
+def save_hash_index():
+    global _hash_index_dirty
+    if _hash_index_dirty:
+        with open(CACHE_FILE, "w", encoding="utf-8") as f:
+            json.dump(_hash_index, f, sort_keys=True)
+        _hash_index_dirty = False
+
+
+def _forget_hash(rel_path):
+    global _hash_index_dirty
+    if _load_hash_index().pop(rel_path, None) is not None:
+        _hash_index_dirty = True
+
+
+def _remember_hash(rel_path, digest, st):
+    global _hash_index_dirty
+    _load_hash_index()[rel_path] = [digest, st.st_size, st.st_mtime_ns]
+    _hash_index_dirty = True
+
+
+def _write_disk(rel_path, content):
+    """Write ``content`` unless the file already holds exactly those bytes;
+    ``None`` removes the file.
+
+    Returns True if the file was written. Unchanged files keep their mtime, so
+    git's stat cache and file watchers are left alone.
+    """
+    full = os.path.join(REPO_DIR, rel_path)
+    if content is None:
+        _forget_hash(rel_path)
+        try:
+            os.remove(full)
+        except FileNotFoundError:
+            return False
+        return True
+    digest = hashlib.sha1(content.encode("utf-8")).hexdigest()
+    try:
+        st = os.stat(full)
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        entry = _load_hash_index().get(rel_path)
+        if entry == [digest, st.st_size, st.st_mtime_ns]:
+            return False
+        if _read_disk(rel_path) == content:
+            _remember_hash(rel_path, digest, st)
+            return False
+    started = time.perf_counter()
+    os.makedirs(os.path.dirname(full), exist_ok=True)
+    with open(full, "w", encoding="utf-8") as f:
+        f.write(content)
+    _count_write(rel_path, len(content.encode("utf-8")), time.perf_counter() - started)
+    _remember_hash(rel_path, digest, os.stat(full))
+    return True
+
+
+# ── Code generation steps ─────────────────────────────────────────────────
+# Paths written by the step currently being rendered (relative to REPO_DIR).
+_touched = []
+
+
+def _touch(rel_path):
+    if rel_path not in _touched:
+        _touched.append(rel_path)
+
+
+def read_file(rel_path):
+    """Current content of a generated file (overlay first), or None."""
+    if _overlay is not None:
+        return _overlay.read(rel_path)
+    return _read_disk(rel_path)
+
+
+def write_file(rel_path, content):
+    """Write a generated file; only files whose content changed are recorded
+    as touched by the current step."""
+    if _overlay is not None:
+        changed = _overlay.write(rel_path, content)
+    else:
+        changed = _write_disk(rel_path, content)
+    if changed:
+        _touch(rel_path)
+    return changed
+
+
+def list_files(rel_dir):
+    """Names of the files directly in ``rel_dir``, as the active overlay (if
+    any) would leave the working tree."""
+    full = os.path.join(REPO_DIR, rel_dir)
+    try:
+        names = {n for n in os.listdir(full) if os.path.isfile(os.path.join(full, n))}
+    except FileNotFoundError:
+        names = set()
+    if _overlay is not None:
+        prefix = rel_dir.rstrip("/") + "/" if rel_dir else ""
+        for rel_path, content in _overlay.files.items():
+            name = rel_path[len(prefix):]
+            if rel_path.startswith(prefix) and "/" not in name:
+                if content is None:
+                    names.discard(name)
+                else:
+                    names.add(name)
+    return sorted(names)
+
+
+def remove_file(rel_path):
+    """Delete a generated file; recorded as touched if it existed."""
+    if _overlay is not None:
+        changed = _overlay.remove(rel_path)
+    else:
+        changed = _write_disk(rel_path, None)
+    if changed:
+        _touch(rel_path)
+    return changed
+
+
+def append_file(rel_path, content):
+    if _overlay is not None:
+        changed = _overlay.append(rel_path, content)
+    elif content:
+        started = time.perf_counter()
+        full = os.path.join(REPO_DIR, rel_path)
+        with open(full, "a", encoding="utf-8") as f:
+            f.write(content)
+        _count_write(rel_path, len(content.encode("utf-8")), time.perf_counter() - started)
+        _forget_hash(rel_path)
+        changed = True
+    else:
+        changed = False
+    if changed:
+        _touch(rel_path)
+    return changed
+
+
+def template(name, **values):
+    """Read the packaged step template ``name`` (``"step_9/index.html"``) and
+    fill in its ``{{key}}`` placeholders.
+
+    Templates are read from ``fzbuilder/templates`` only when a step renders
+    and are not cached, so step bodies never stay resident in the process.
+    """
+    res = resources.files(__package__).joinpath("templates")
+    for part in (name + ".tmpl").split("/"):
+        res = res.joinpath(part)
+    text = res.read_text(encoding="utf-8")
+    for key, value in values.items():
+        text = text.replace("{{" + key + "}}", str(value))
+    return text
+
+
+# Comment syntax for write_block markers, by file extension (default: "//").
+_BLOCK_COMMENTS = {".css": ("/* ", " */"), ".html": ("<!-- ", " -->")}
+
+
+def write_block(rel_path, name, content, legacy=None):
+    """Replace the block delimited by ``fz:begin <name>`` / ``fz:end <name>``
+    marker comments in a generated file, appending it the first time.
+
+    Unlike append_file, re-running the same cycle keeps the file at a constant
+    size. ``legacy`` is an optional regex matching copies that older builders
+    appended without markers; they are stripped from the rest of the file.
+    """
+    prefix, suffix = _BLOCK_COMMENTS.get(os.path.splitext(rel_path)[1], ("// ", ""))
+    begin = f"{prefix}fz:begin {name}{suffix}\n"
+    end = f"{prefix}fz:end {name}{suffix}\n"
+    block = begin + content.strip("\n") + "\n" + end
+
+    current = read_file(rel_path) or ""
+    start = current.find(begin)
+    stop = current.find(end, start) if start >= 0 else -1
+    if stop >= 0:
+        head, tail = current[:start], current[stop + len(end):]
+    else:
+        head, tail = current, ""
+    if legacy:
+        head = re.sub(legacy, "", head, flags=re.DOTALL)
+        tail = re.sub(legacy, "", tail, flags=re.DOTALL)
+    if stop < 0 and head:
+        head = head.rstrip("\n") + "\n\n"
+    return write_file(rel_path, head + block + tail)
+
+
+# ── Step journal (.build_journal) ──────────────────────────────────────────
+# Append-only JSON lines. A step (or group of steps) is bracketed by a "begin"
+# record, written once its files are rendered but before they are flushed, and
+# a "commit" record carrying the resulting commit SHA. "step" records move the
+# counter without a commit (backfill) and carry scheduler metadata. "abort"
+# closes a "begin" that recover() could not reproduce; its step runs again.
+#
+# auto_build.sh still resumes from .build_step, so every record that moves the
+# counter is mirrored there, and read_step honours a .build_step the script
+# has advanced past the journal.
+def _journal(op, **fields):
+    record = {"op": op, "at": datetime.now().isoformat(timespec="seconds")}
+    record.update(fields)
+    with open(JOURNAL_FILE, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+    if "next" in record and op in ("commit", "step"):
+        _write_legacy_step(record["next"])
+
+
+def journal_records_reversed():
+    """Yield journal records newest first, reading the file from the end.
+
+    A torn last line (crash mid-append) is skipped.
+    """
+    try:
+        f = open(JOURNAL_FILE, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        f.seek(0, os.SEEK_END)
+        pos, tail = f.tell(), b""
+        while pos > 0:
+            size = min(65536, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + tail).split(b"\n")
+            tail = lines.pop(0)
+            for line in reversed(lines):
+                record = _parse_record(line)
+                if record:
+                    yield record
+        record = _parse_record(tail)
+        if record:
+            yield record
+
+
+def _parse_record(line):
+    try:
+        return json.loads(line) if line.strip() else None
+    except ValueError:
+        return None
+
+
+def _legacy_step():
+    # auto_build.sh (and trees built before the journal) keep a bare step
+    # number in .build_step.
+    try:
+        with open(STEP_FILE) as f:
+            return int(f.readline().strip())
+    except (OSError, ValueError):
+        return 0
+
+
+def _write_legacy_step(n):
+    tmp = STEP_FILE + ".tmp"
+    with open(tmp, "w") as f:
+        f.write(f"{n}\n")
+    os.replace(tmp, STEP_FILE)
+
+
+def read_step():
+    for record in journal_records_reversed():
+        if record["op"] in ("commit", "step"):
+            return max(record["next"], _legacy_step())
+    return _legacy_step()
+
+
+def read_step_meta():
+    """Scheduler metadata (e.g. ``next_run_at``) from the latest record carrying it."""
+    for record in journal_records_reversed():
+        if "meta" in record:
+            return record["meta"]
+    return {}
+
+
+def write_step(n, **meta):
+    fields = {"next": n}
+    if meta:
+        fields["meta"] = {k: v for k, v in meta.items() if v is not None}
+    _journal("step", **fields)
+
+
+def _head():
+    repo = git_repo()
+    if repo is not None:
+        try:
+            sha, body = repo.head_commit()
+            return sha, body and body.strip()
+        except (Unsupported, KeyError):
+            pass
+    code, out, _ = git("log", "-1", "--format=%H%n%B")
+    if code != 0:
+        return None, None
+    sha, _, body = out.partition("\n")
+    return sha, body.strip()
+
+
+def _content_hash(content):
+    # A removed file hashes like an empty one, as _read_disk(...) or "" does.
+    return hashlib.sha1((content or "").encode("utf-8")).hexdigest()
+
+
+def _restore_from_head(paths):
+    """Put ``paths`` back as HEAD has them, removing those HEAD lacks."""
+    code, out, _ = git("ls-tree", "-r", "-z", "--name-only", "HEAD", "--", *paths)
+    tracked = [p for p in out.split("\0") if p] if code == 0 else []
+    if tracked:
+        git("checkout", "-q", "HEAD", "--", *tracked)
+    for rel_path in set(paths) - set(tracked):
+        _write_disk(rel_path, None)
+
+
+def recover(log=print):
+    """Finish a step that was interrupted between its "begin" and "commit"
+    journal records without running the step again.
+
+    If the commit landed, only the "commit" record is written. Otherwise the
+    recorded paths are reset to HEAD and re-rendered in memory; if every file
+    matches its journaled hash they are written and committed with the
+    recorded message, and if not the step is aborted so it runs afresh.
+    Returns True if anything was recovered.
+    """
+    last = next((r for r in journal_records_reversed() if r["op"] != "step"), None)
+    if last is None or last["op"] != "begin":
+        return False
+
+    files = last["files"]
+    stale = [p for p, digest in files.items()
+             if _content_hash(_read_disk(p) or "") != digest]
+    head, body = _head()
+    if head and head != last.get("parent") and body == last["message"].strip():
+        if stale:
+            # Committed by fast-import before the working tree was written.
+            git("checkout", "-q", "HEAD", "--", *stale)
+        _journal("commit", step=last["step"], next=last["next"], sha=head,
+                 message=last["message"], recovered=True)
+        log(f"Recovered step {last['step']}: commit {head[:10]} had already landed.")
+        return True
+
+    if stale:
+        # Render from the same inputs the interrupted step saw
+        _restore_from_head(list(files))
+        overlay, _ = render_range(last["step"], last["next"] - last["step"])
+        differs = [p for p, digest in files.items()
+                   if p not in overlay.files or _content_hash(overlay.files[p]) != digest]
+        if differs:
+            save_hash_index()
+            _journal("abort", step=last["step"], message=last["message"], differs=differs)
+            log(f"Step {last['step']} rendered differently on retry ({differs[0]}); "
+                f"reset its files to HEAD to run it again.")
+            return True
+        for rel_path in files:
+            _write_disk(rel_path, overlay.files[rel_path])
+        save_hash_index()
+    committed = git_commit(last["message"], paths=list(files))
+    sha = _head()[0] if committed else None
+    _journal("commit", step=last["step"], next=last["next"], sha=sha,
+             message=last["message"], recovered=True)
+    log(f"Recovered step {last['step']}: committed the files it had already rendered.")
+    return True
+
+
+def group_message(messages, first_step):
+    """Commit message for several steps committed together."""
+    if len(messages) == 1:
+        return messages[0]
+    last = first_step + len(messages) - 1
+    return (f"Build steps {first_step}-{last}\n\n"
+            + "\n".join(f"- {msg}" for msg in messages))
+
+
+def _steps():
+    # Imported on first use so that importing core does not load every step body.
+    from . import steps
+    return steps
+
+
+def _assets():
+    from . import assets
+    return assets
+
+
+def step_count():
+    """Number of feature steps before the maintenance cycles take over."""
+    return len(_steps().STEPS)
+
+
+def run_step(step_num):
+    """Render feature step ``step_num`` (or the maintenance cycle that follows
+    the feature steps) into the working tree and return its commit message.
+
+    Afterwards ``_touched`` lists the files whose content actually changed;
+    it is empty when the step regenerated identical bytes.
+    """
+    steps = _steps()
+    _touched.clear()
+    if step_num < len(steps.STEPS):
+        msg = steps.STEPS[step_num]()
+    else:
+        # Rotating maintenance updates that write real code
+        version = step_num - len(steps.STEPS) + 1
+        cycle = (version - 1) % len(steps.MAINTENANCE_CYCLES)
+        msg = steps.MAINTENANCE_CYCLES[cycle](version)
+        content = read_file("package.json")
+        if content is not None:
+            write_file("package.json", re.sub(r'"version":\s*"[^"]*"',
+                                              f'"version": "1.0.{version}"', content))
+    if step_num >= _assets().BUNDLE_FROM_STEP:
+        _assets().build_assets(list(_touched))
+    if _overlay is None:
+        save_hash_index()
+    return msg
+
+
+def commit_step(count=1, log=print, author_date=None):
+    """Render the next ``count`` steps and commit whatever they changed as one
+    commit, journaling before and after so a crash can be resumed by
+    recover(). Appends a ``step`` record to METRICS_FILE.
+
+    Returns ``(step_num, message, committed)`` for the first step rendered.
+    """
+    recover(log=log)
+    step_num = read_step()
+    reset_metrics()
+    started = time.perf_counter()
+    overlay, rendered = render_range(step_num, count)
+    msg = group_message([m for _, m, _ in rendered], step_num)
+    files = {}
+    for _, _, snapshot in rendered:
+        files.update(snapshot)
+    # Files created and removed again within the range never reach git.
+    files = {p: c for p, c in files.items() if c is not None or _read_disk(p) is not None}
+    finished_render = time.perf_counter()
+
+    committed, sha = False, None
+    if files:
+        _journal("begin", step=step_num, next=step_num + count, message=msg,
+                 parent=_head()[0], files={p: _content_hash(c) for p, c in files.items()})
+        overlay.flush()
+        committed = git_commit(msg, paths=list(files), author_date=author_date)
+        sha = _head()[0] if committed else None
+    _journal("commit", step=step_num, next=step_num + count, sha=sha, message=msg)
+    finished = time.perf_counter()
+    record_metrics("step", step=step_num, steps=count, message=msg, committed=committed,
+                   wall_secs=finished - started, render_secs=finished_render - started,
+                   commit_secs=finished - finished_render)
+    _metrics.clear()
+    return step_num, msg, committed
+
+
+def render_range(start, count, overlay=None):
+    """Render steps ``start`` .. ``start + count - 1`` into an overlay without
+    touching the working tree.
+
+    Returns ``(overlay, rendered)`` where ``rendered`` lists, per step, its
+    message and a snapshot of the files it wrote.
+    """
+    global _overlay
+    overlay = overlay or Overlay()
+    rendered = []
+    previous, _overlay = _overlay, overlay
+    try:
+        for step_num in range(start, start + count):
+            msg = run_step(step_num)
+            rendered.append((step_num, msg, {p: overlay.files[p] for p in _touched}))
+    finally:
+        _overlay = previous
+    return overlay, rendered
+
+
+def dry_run(count, out=print):
+    """Render the next ``count`` steps in memory and print the byte delta each
+    changed file would see, without touching the working tree."""
+    overlay, rendered = render_range(read_step(), count)
+    for num, msg, _ in rendered:
+        out(f"step {num}: {msg}")
+    total = 0
+    for rel_path, old, new in overlay.diff():
+        delta = (new or 0) - (old or 0)
+        total += delta
+        state = ("new" if old is None else "removed" if new is None
+                 else f"{old} -> {new} bytes")
+        out(f"  {delta:+8d}  {rel_path}  ({state})")
+    out(f"  {total:+8d}  total")
+
+
+# ── Scheduling ─────────────────────────────────────────────────────────────
+_CRON_FIELDS = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))
+
+
+def _parse_cron_field(text, lo, hi):
+    values = set()
+    for part in text.split(","):
+        rng, _, step_txt = part.partition("/")
+        step_by = int(step_txt) if step_txt else 1
+        if rng == "*":
+            start, end = lo, hi
+        elif "-" in rng:
+            start, end = (int(v) for v in rng.split("-", 1))
+        else:
+            start = int(rng)
+            end = hi if step_txt else start
+        if not lo <= start <= end <= hi or step_by < 1:
+            raise ValueError(f"cron field out of range: {part!r}")
+        values.update(range(start, end + 1, step_by))
+    return values
+
+
+class Schedule:
+    """When the builder should run next: every ``interval`` seconds, or at the
+    times matched by a five-field cron expression (``"0 9-17 * * 1-5"``), plus
+    up to ``jitter`` random seconds so many builders don't fire in lockstep."""
+
+    def __init__(self, interval=INTERVAL, cron=None, jitter=0):
+        self.interval = interval
+        self.cron = cron
+        self.jitter = jitter
+        if cron is not None:
+            fields = cron.split()
+            if len(fields) != 5:
+                raise ValueError("cron expressions need exactly 5 fields")
+            (self._minutes, self._hours, self._days,
+             self._months, dows) = (_parse_cron_field(f, lo, hi)
+                                    for f, (lo, hi) in zip(fields, _CRON_FIELDS))
+            self._dows = {d % 7 for d in dows}
+            self._any_day = fields[2] == "*"
+            self._any_dow = fields[4] == "*"
+            self._cron_next(time.time())  # "0 0 31 2 *" parses but never fires
+
+    @classmethod
+    def parse(cls, spec, jitter=0):
+        """``"5"`` means every 5 minutes; anything else is a cron expression."""
+        spec = spec.strip()
+        if spec.isdigit():
+            if int(spec) < 1:
+                raise ValueError("interval must be at least 1 minute")
+            return cls(interval=int(spec) * 60, jitter=jitter)
+        return cls(cron=spec, jitter=jitter)
+
+    def describe(self):
+        base = f"cron '{self.cron}'" if self.cron else f"every {self.interval // 60} min"
+        return base + (f" (+ up to {self.jitter // 60} min jitter)" if self.jitter else "")
+
+    def next_after(self, ts, jitter=True):
+        """Epoch seconds of the first run strictly after ``ts``."""
+        if self.cron is None:
+            due = ts + self.interval
+        else:
+            due = self._cron_next(ts)
+        return due + (random.uniform(0, self.jitter) if jitter and self.jitter else 0)
+
+    def _day_matches(self, t):
+        dom = t.day in self._days
+        dow = (t.weekday() + 1) % 7 in self._dows
+        if self._any_day or self._any_dow:
+            return dom and dow
+        return dom or dow
+
+    def _cron_next(self, ts):
+        t = datetime.fromtimestamp(ts).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = t + timedelta(days=366 * 5)
+        while t < limit:
+            if t.month not in self._months:
+                t = (t.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(t):
+                t = t.replace(hour=0, minute=0) + timedelta(days=1)
+            elif t.hour not in self._hours:
+                t = t.replace(minute=0) + timedelta(hours=1)
+            elif t.minute not in self._minutes:
+                t += timedelta(minutes=1)
+            else:
+                return t.timestamp()
+        raise ValueError(f"cron expression never fires: {self.cron!r}")
+
+
+def wait_until(deadline, stop_event, max_nap=300):
+    """Block until wall-clock ``deadline`` or until ``stop_event`` is set.
+
+    Sleeps in naps of at most ``max_nap`` seconds so a suspended laptop or a
+    clock change is noticed; returns True if stopped.
+    """
+    while True:
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            return stop_event.is_set()
+        if stop_event.wait(min(remaining, max_nap)):
+            return True
+
+
+# ── Catch-up after downtime ───────────────────────────────────────────────
+CATCH_UP_POLICIES = ("skip", "replay", "collapse")
+CATCH_UP_LIMIT = 1000  # never replay more than this many missed runs at once
+
+
+def _last_run_at():
+    for record in journal_records_reversed():
+        if record["op"] == "commit":
+            return datetime.fromisoformat(record["at"]).timestamp()
+    return None
+
+
+def missed_runs(schedule, now=None, limit=CATCH_UP_LIMIT):
+    """Scheduled run times that passed while the builder was not running,
+    starting from the journaled ``next_run_at`` (or the last commit)."""
+    now = time.time() if now is None else now
+    try:
+        due = float(read_step_meta()["next_run_at"])
+    except (KeyError, ValueError):
+        last = _last_run_at()
+        if last is None:
+            return []
+        due = schedule.next_after(last, jitter=False)
+    runs = []
+    while due <= now and len(runs) < limit:
+        runs.append(due)
+        due = schedule.next_after(due, jitter=False)
+    return runs
+
+
+def catch_up(schedule, policy="skip", backdate=False, log=print):
+    """Deal with the runs missed while the builder was offline.
+
+    ``skip`` drops them, ``replay`` commits one step per missed run in a
+    single fast-import pass, and ``collapse`` renders all of them into one
+    grouped commit. With ``backdate`` the author dates are set to the
+    missed run times. Afterwards the next run is scheduled from now.
+    Returns the number of commits made.
+    """
+    if policy not in CATCH_UP_POLICIES:
+        raise ValueError(f"unknown catch-up policy: {policy!r}")
+    runs = missed_runs(schedule)
+    if not runs:
+        return 0
+    log(f"Missed {len(runs)} scheduled run(s) since "
+        f"{datetime.fromtimestamp(runs[0]):%Y-%m-%d %H:%M}; catch-up policy: {policy}.")
+    commits = 0
+    if policy == "replay":
+        commits = fast_import_steps(len(runs), start=int(time.time()), spacing=0, log=log,
+                                    author_dates=runs if backdate else None)
+    elif policy == "collapse":
+        _, _, committed = commit_step(len(runs), log=log,
+                                      author_date=runs[-1] if backdate else None)
+        commits = int(committed)
+    write_step(read_step(), next_run_at=f"{schedule.next_after(time.time()):.0f}")
+    return commits
+
+
+# ── Headless backfill (git fast-import) ────────────────────────────────────
+def _fast_import_data(payload):
+    if isinstance(payload, str):
+        payload = payload.encode("utf-8")
+    return b"data %d\n%s\n" % (len(payload), payload)
+
+
+def _parse_when(value):
+    """Accept an epoch number or an ISO-8601 date/time (local time if naive)."""
+    try:
+        return int(float(value))
+    except ValueError:
+        return int(datetime.fromisoformat(value).timestamp())
+
+
+def backfill(maintenance_versions=0, start=None, spacing=INTERVAL, log=print):
+    """Render the remaining STEPS plus ``maintenance_versions`` maintenance
+    cycles and commit them all through one ``git fast-import`` stream.
+
+    Commits are dated ``start``, ``start + spacing``, ... (epoch seconds); by
+    default the series is laid out so the last commit is dated now. Steps
+    that change nothing get no commit; returns the number of commits written.
+    """
+    return fast_import_steps(backfill_count(maintenance_versions),
+                             start=start, spacing=spacing, log=log)
+
+
+def backfill_count(maintenance_versions=0):
+    """Steps a backfill would render: the remaining STEPS plus N maintenance versions."""
+    return max(step_count() - read_step(), 0) + maintenance_versions
+
+
+def fast_import_steps(count, start=None, spacing=INTERVAL, log=print, author_dates=None):
+    """Render the next ``count`` steps and commit them through one
+    ``git fast-import`` stream (see backfill). ``author_dates`` optionally
+    gives each step its own author date (epoch seconds)."""
+    recover(log=log)
+    step_num = read_step()
+    if count <= 0:
+        return 0
+
+    reset_metrics()
+    started = time.perf_counter()
+    code, ref, _ = git("symbolic-ref", "-q", "HEAD")
+    if code != 0:
+        raise RuntimeError("HEAD is detached; check out a branch before backfilling.")
+    code, parent, _ = git("rev-parse", "-q", "--verify", "HEAD")
+    parent = parent if code == 0 else None
+    _, name, _ = git("config", "user.name")
+    _, email, _ = git("config", "user.email")
+    ident = f"{name or 'FriendZone Builder'} <{email or 'builder@friendzone.local'}>"
+    if start is None:
+        start = int(time.time()) - spacing * (count - 1)
+
+    overlay, rendered = render_range(step_num, count)
+    rendered_at = time.perf_counter()
+    changed = [(msg, files) for _, msg, files in rendered if files]
+    if changed:
+        _journal("begin", step=step_num, next=step_num + count, message=changed[-1][0],
+                 parent=parent, files={p: _content_hash(overlay.files[p])
+                                       for _, files in changed for p in files})
+    commits = 0
+    proc = subprocess.Popen(["git", "fast-import", "--quiet"], cwd=REPO_DIR,
+                            stdin=subprocess.PIPE)
+    _metrics["git_calls"] += 1
+    try:
+        for i, (num, msg, files) in enumerate(rendered):
+            if not files:
+                log(f"Step {num} produced no changes; nothing to commit.")
+                continue
+            header = f"commit {ref}\n"
+            if author_dates:
+                header += f"author {ident} {git_date(author_dates[i])}\n"
+            header += f"committer {ident} {git_date(start + i * spacing)}\n"
+            chunk = [header.encode("utf-8"), _fast_import_data(msg)]
+            if parent:
+                chunk.append(f"from {parent}\n".encode("ascii"))
+                parent = None
+            for rel_path, content in files.items():
+                if content is None:
+                    chunk.append(f"D {rel_path}\n".encode("utf-8"))
+                    continue
+                chunk.append(f"M 100644 inline {rel_path}\n".encode("utf-8"))
+                chunk.append(_fast_import_data(content))
+            proc.stdin.write(b"".join(chunk) + b"\n")
+            commits += 1
+            log(f"Rendered step {num}: {msg}")
+    finally:
+        proc.stdin.close()
+        code = proc.wait()
+        _metrics["git_secs"] += time.perf_counter() - rendered_at
+    if code != 0:
+        raise RuntimeError(f"git fast-import failed with exit code {code}.")
+
+    overlay.flush()
+    # fast-import only moves the branch; bring the index in line with it.
+    git("reset", "-q")
+    _journal("commit", step=step_num, next=step_num + count,
+             sha=_head()[0] if commits else None,
+             message=changed[-1][0] if changed else None)
+    step_num += count
+    finished = time.perf_counter()
+    record_metrics("backfill", step=step_num - count, steps=count, commits=commits,
+                   wall_secs=finished - started, render_secs=rendered_at - started)
+    _metrics.clear()
+    return commits
+
+
+# ── Multi-repository controller ────────────────────────────────────────────
+def build_steps(count, group=False, log=print):
+    """Run the next ``count`` steps with one commit each, or with a single
+    commit for all of them when ``group`` is set; returns commits made."""
+    commits = 0
+    for size in ([count] if group else [1] * count):
+        _, msg, committed = commit_step(size, log=log)
+        if committed:
+            commits += 1
+            log(f"Committed: {msg.splitlines()[0]}")
+        else:
+            log("Nothing new to commit (no changes).")
+    return commits
+
+
+def build_repo(repo_dir, steps=1, backfill_versions=None, group=False,
+               schedule=None, catch_up_policy=None, backdate=False,
+               start=None, spacing=INTERVAL):
+    """Process-pool worker: advance one target repo and report how it went.
+
+    With a ``schedule``, runs missed while the controller was down are first
+    handled by ``catch_up_policy`` and the repo's next run time is recorded.
+    """
+    set_repo(repo_dir)
+    started = time.perf_counter()
+    result = {"repo": REPO_DIR, "from": read_step(), "commits": 0, "error": None}
+    quiet = lambda msg: None  # noqa: E731
+    try:
+        if discover(REPO_DIR) is None:
+            raise RuntimeError("not a git repository")
+        if schedule is not None and catch_up_policy:
+            result["commits"] += catch_up(schedule, catch_up_policy, backdate, log=quiet)
+        if backfill_versions is not None:
+            result["commits"] += backfill(backfill_versions, start=start, spacing=spacing,
+                                          log=quiet)
+        else:
+            result["commits"] += build_steps(steps, group=group, log=quiet)
+        if schedule is not None:
+            write_step(read_step(),
+                       next_run_at=f"{schedule.next_after(time.time(), jitter=False):.0f}")
+    except Exception as e:  # reported in the summary, never kills the pool
+        result["error"] = str(e) or type(e).__name__
+    result["to"] = read_step()
+    result["secs"] = time.perf_counter() - started
+    return result
+
+
+def format_summary(results):
+    rows = [("Repository", "Step", "Commits", "Time", "Status")]
+    for r in results:
+        rows.append((r["repo"], f"{r['from']} -> {r['to']}", str(r["commits"]),
+                     f"{r['secs']:.2f}s", r["error"] or "ok"))
+    widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+    lines = ["  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in rows]
+    lines.insert(1, "  ".join("-" * w for w in widths))
+    return "\n".join(lines)
+
+
+def build_many(repos, steps=1, workers=None, backfill_versions=None, group=False,
+               schedule=None, catch_up_policy=None, backdate=False,
+               start=None, spacing=INTERVAL, out=print):
+    """Advance every repo in ``repos`` on a process pool and print a summary."""
+    from concurrent.futures import ProcessPoolExecutor
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(build_repo, repo, steps, backfill_versions, group,
+                               schedule, catch_up_policy, backdate, start, spacing)
+                   for repo in repos]
+        results = [f.result() for f in futures]
+    out(format_summary(results))
+    failed = sum(1 for r in results if r["error"])
+    out(f"{len(results)} repositories, {sum(r['commits'] for r in results)} commits, "
+        f"{failed} failed, {time.perf_counter() - started:.2f}s.")
+    return results
@@ -0,0 +1,490 @@
+"""
+In-process git plumbing for the builder's commit path.
+
+``git add`` + ``git commit`` cost two process spawns, and a repository
+discovery and config load each, for every step. GitRepo does that work once
+per session: it keeps the parsed index and config in memory, writes blobs,
+trees and commits as loose objects, rewrites the index and moves the branch
+itself. Objects that are not loose (packed history) are read through one
+long-lived ``git cat-file --batch`` process.
+
+Repositories that need something this does not implement (a v4 or split
+index, commit hooks, signing, attribute filters, a non-sha1 object format,
+...) raise Unsupported, and the caller falls back to the git command line.
+"""
+
+import hashlib
+import os
+import stat
+import struct
+import subprocess
+import zlib
+
+ZERO_SHA = "0" * 40
+GC_EVERY = 100  # commits between ``git gc --auto`` runs, as `git commit` would do
+
+# Hooks `git commit` would run; their presence means we must not bypass it.
+_COMMIT_HOOKS = ("pre-commit", "prepare-commit-msg", "commit-msg", "post-commit")
+# Environment that changes where or how git reads and writes the repository.
+_ENV_OVERRIDES = ("GIT_DIR", "GIT_WORK_TREE", "GIT_INDEX_FILE", "GIT_OBJECT_DIRECTORY",
+                  "GIT_AUTHOR_DATE", "GIT_COMMITTER_DATE")
+# Per-directory attributes; this writer applies no filters or conversions.
+_ATTRIBUTES = ".gitattributes"
+
+
+class Unsupported(RuntimeError):
+    """The repository needs a git feature GitRepo does not implement."""
+
+
+def discover(path):
+    """Return ``(work_tree, git_dir)`` for the repository containing ``path``
+    (as ``git status`` would find it), or None."""
+    path = os.path.abspath(path)
+    while True:
+        dot_git = os.path.join(path, ".git")
+        if os.path.isdir(dot_git):
+            if os.path.isfile(os.path.join(dot_git, "HEAD")):
+                return path, dot_git
+        elif os.path.isfile(dot_git):
+            with open(dot_git, encoding="utf-8") as f:
+                line = f.read().strip()
+            if line.startswith("gitdir:"):
+                git_dir = os.path.normpath(os.path.join(path, line[7:].strip()))
+                if os.path.isfile(os.path.join(git_dir, "HEAD")):
+                    return path, git_dir
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+def _is_true(value):
+    return value is not None and value.lower() in ("", "true", "yes", "on", "1")
+
+
+def _is_attributes(key):
+    return key.rsplit(b"/", 1)[-1] == _ATTRIBUTES.encode("ascii")
+
+
+def _clean_message(message):
+    """Whitespace cleanup as ``git commit -m`` does it."""
+    lines, blank = [], False
+    for line in message.strip().splitlines():
+        line = line.rstrip()
+        if line or not blank:
+            lines.append(line)
+        blank = not line
+    return "\n".join(lines) + "\n"
+
+
+class GitRepo:
+    """One repository, opened once and reused for every commit."""
+
+    def __init__(self, path):
+        for name in _ENV_OVERRIDES:
+            if name in os.environ:
+                raise Unsupported(f"{name} is set")
+        found = discover(path)
+        if found is None:
+            raise Unsupported(f"not a git repository: {path}")
+        self.work_tree, self.git_dir = found
+        self.prefix = os.path.relpath(os.path.abspath(path), self.work_tree)
+        self.prefix = "" if self.prefix == "." else self.prefix.replace(os.sep, "/") + "/"
+        try:
+            with open(os.path.join(self.git_dir, "commondir"), encoding="utf-8") as f:
+                self.common_dir = os.path.normpath(os.path.join(self.git_dir, f.read().strip()))
+        except FileNotFoundError:
+            self.common_dir = self.git_dir
+        self.objects_dir = os.path.join(self.common_dir, "objects")
+        self.index_path = os.path.join(self.git_dir, "index")
+        self.config = self._load_config()
+        self._check_config()
+        self._check_work_tree()
+        self.filemode = self.config.get("core.filemode", "true") != "false"
+        self.log_refs = _is_true(self.config.get("core.logallrefupdates", "true"))
+        level = self.config.get("core.loosecompression") or self.config.get("core.compression")
+        self.compression = int(level) if level not in (None, "-1") else 1
+        self._known = set()        # object ids known to exist
+        self._index = None         # path (bytes) -> [stat fields, sha, flags, extended flags]
+        self._index_stamp = None   # (mtime_ns, size, ino) of the index we parsed
+        self._tree = (None, {})    # (commit, {path: (mode, sha)}) of the last tree read
+        self._cat_file = None
+        self._commits = 0
+
+    def close(self):
+        if self._cat_file is not None:
+            self._cat_file.stdin.close()
+            self._cat_file.wait()
+            self._cat_file = None
+
+    # ── Config ─────────────────────────────────────────────────────────
+    def _load_config(self):
+        # One spawn per session: git resolves system/global/local files and includes.
+        result = subprocess.run(["git", "config", "-z", "--list"], cwd=self.work_tree,
+                                capture_output=True)
+        if result.returncode != 0:
+            raise Unsupported("git config failed")
+        config = {}
+        for item in result.stdout.decode("utf-8", "replace").split("\0"):
+            if item:
+                key, _, value = item.partition("\n")
+                config[key.lower()] = value
+        return config
+
+    def _check_config(self):
+        get = self.config.get
+        if get("extensions.objectformat", "sha1") != "sha1":
+            raise Unsupported("object format is not sha1")
+        if get("extensions.refstorage", "files") != "files":
+            raise Unsupported("refs are not stored as files")
+        for key in ("commit.gpgsign", "core.splitindex", "feature.manyfiles", "core.fsmonitor"):
+            if _is_true(get(key)):
+                raise Unsupported(f"{key} is enabled")
+        if get("index.version", "2") not in ("2", "3"):
+            raise Unsupported("index.version is not 2 or 3")
+        if get("core.autocrlf", "false").lower() != "false" or get("core.attributesfile"):
+            raise Unsupported("line-ending or attribute conversion is configured")
+        if get("i18n.commitencoding", "utf-8").lower() not in ("utf-8", "utf8"):
+            raise Unsupported("commit encoding is not UTF-8")
+        if get("core.sharedrepository"):
+            raise Unsupported("core.sharedRepository is set")
+        if os.path.exists(os.path.join(self.common_dir, "info", "attributes")):
+            raise Unsupported("info/attributes exists")
+
+    def _check_work_tree(self):
+        # Attribute files added after the repository was opened are caught per commit.
+        for root, dirs, files in os.walk(self.work_tree):
+            if _ATTRIBUTES in files:
+                raise Unsupported("the work tree has .gitattributes files")
+            dirs[:] = [d for d in dirs if d != ".git"]
+
+    def _check_attributes(self, entries, paths):
+        if any(_is_attributes(key) for key in entries):
+            raise Unsupported("the index has .gitattributes files")
+        dirs = set()
+        for rel_path in paths:
+            parts = self._key(rel_path).decode("utf-8").split("/")
+            dirs.update(tuple(parts[:i]) for i in range(len(parts)))
+        for parts in dirs:
+            if os.path.exists(os.path.join(self.work_tree, *parts, _ATTRIBUTES)):
+                raise Unsupported("the work tree has .gitattributes files")
+
+    def _check_hooks(self):
+        hooks = self.config.get("core.hookspath")
+        hooks_dir = (os.path.join(self.work_tree, os.path.expanduser(hooks)) if hooks
+                     else os.path.join(self.common_dir, "hooks"))
+        for name in _COMMIT_HOOKS:
+            hook = os.path.join(hooks_dir, name)
+            if os.path.isfile(hook) and os.access(hook, os.X_OK):
+                raise Unsupported(f"{name} hook is installed")
+
+    def identity(self, role):
+        """``Name <email>`` for ``role`` ("AUTHOR" or "COMMITTER")."""
+        get = self.config.get
+        name = (os.environ.get(f"GIT_{role}_NAME") or get(f"{role.lower()}.name")
+                or get("user.name"))
+        email = (os.environ.get(f"GIT_{role}_EMAIL") or get(f"{role.lower()}.email")
+                 or get("user.email") or os.environ.get("EMAIL"))
+        if not name or not email:
+            raise Unsupported("no identity configured")
+        return f"{name} <{email}>"
+
+    # ── Objects ────────────────────────────────────────────────────────
+    def write_object(self, kind, data):
+        """Store ``data`` as a loose object unless it exists; return its id."""
+        raw = b"%s %d\0" % (kind.encode("ascii"), len(data)) + data
+        sha = hashlib.sha1(raw).hexdigest()
+        if sha in self._known:
+            return sha
+        path = os.path.join(self.objects_dir, sha[:2], sha[2:])
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                f.write(zlib.compress(raw, self.compression))
+            os.chmod(tmp, 0o444)
+            os.replace(tmp, path)
+        self._known.add(sha)
+        return sha
+
+    def read_object(self, sha):
+        """``(kind, data)`` for object ``sha``; raises KeyError if missing."""
+        path = os.path.join(self.objects_dir, sha[:2], sha[2:])
+        try:
+            with open(path, "rb") as f:
+                raw = zlib.decompress(f.read())
+        except FileNotFoundError:
+            return self._cat(sha)
+        header, _, data = raw.partition(b"\0")
+        return header.split(b" ")[0].decode("ascii"), data
+
+    def _cat(self, sha):
+        if self._cat_file is None:
+            self._cat_file = subprocess.Popen(["git", "cat-file", "--batch"], cwd=self.work_tree,
+                                              stdin=subprocess.PIPE, stdout=subprocess.PIPE)
+        self._cat_file.stdin.write(sha.encode("ascii") + b"\n")
+        self._cat_file.stdin.flush()
+        header = self._cat_file.stdout.readline().split()
+        if len(header) != 3:
+            raise KeyError(sha)
+        data = self._cat_file.stdout.read(int(header[2]))
+        self._cat_file.stdout.read(1)
+        return header[1].decode("ascii"), data
+
+    # ── Refs ───────────────────────────────────────────────────────────
+    def _ref_path(self, name):
+        return os.path.join(self.git_dir if name == "HEAD" else self.common_dir, name)
+
+    def _read_ref(self, name):
+        try:
+            with open(self._ref_path(name), encoding="utf-8") as f:
+                return f.read().strip()
+        except FileNotFoundError:
+            pass
+        try:
+            with open(os.path.join(self.common_dir, "packed-refs"), encoding="utf-8") as f:
+                for line in f:
+                    if line[0] not in "#^" and line.rstrip("\n").endswith(" " + name):
+                        return line.split(" ", 1)[0]
+        except FileNotFoundError:
+            pass
+        return None
+
+    def head(self):
+        """``(ref, sha)`` for HEAD: ``ref`` is None when detached and ``sha``
+        is None on an unborn branch."""
+        ref, value = None, self._read_ref("HEAD")
+        while value and value.startswith("ref: "):
+            ref = value[5:]
+            value = self._read_ref(ref)
+        return ref, value
+
+    def head_commit(self):
+        """``(sha, message)`` of the HEAD commit, or ``(None, None)``."""
+        _, sha = self.head()
+        if sha is None:
+            return None, None
+        _, data = self.read_object(sha)
+        return sha, data.partition(b"\n\n")[2].decode("utf-8", "replace")
+
+    def _lock(self, path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        try:
+            return os.open(path + ".lock", os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        except FileExistsError:
+            raise Unsupported(f"{path}.lock exists") from None
+
+    def _update_ref(self, name, old, new, reflog_line):
+        path = self._ref_path(name)
+        fd = self._lock(path)
+        try:
+            with os.fdopen(fd, "w", encoding="ascii") as f:
+                if self._read_ref(name) != old:
+                    raise RuntimeError(f"{name} moved while committing")
+                f.write(new + "\n")
+            os.replace(path + ".lock", path)
+        except BaseException:
+            os.unlink(path + ".lock")
+            raise
+        for log_name in ([name, "HEAD"] if name != "HEAD" else ["HEAD"]):
+            log_path = os.path.join(self.git_dir if log_name == "HEAD" else self.common_dir,
+                                    "logs", log_name)
+            if self.log_refs or os.path.exists(log_path):
+                os.makedirs(os.path.dirname(log_path), exist_ok=True)
+                with open(log_path, "a", encoding="utf-8") as f:
+                    f.write(reflog_line)
+
+    # ── Index ──────────────────────────────────────────────────────────
+    def _index_stat(self):
+        try:
+            st = os.stat(self.index_path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size, st.st_ino
+
+    def _load_index(self):
+        stamp = self._index_stat()
+        if self._index is not None and stamp == self._index_stamp:
+            return self._index
+        entries = {}
+        if stamp is not None:
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            if data[:4] != b"DIRC" or hashlib.sha1(data[:-20]).digest() != data[-20:]:
+                raise Unsupported("index is damaged")
+            version, count = struct.unpack(">II", data[4:12])
+            if version not in (2, 3):
+                raise Unsupported(f"index version {version}")
+            pos = 12
+            for _ in range(count):
+                fields = struct.unpack(">10I20sH", data[pos:pos + 62])
+                flags, extended, name_at = fields[11], 0, pos + 62
+                if flags & 0x4000:
+                    extended = struct.unpack(">H", data[name_at:name_at + 2])[0]
+                    name_at += 2
+                if flags & 0x3000:
+                    raise Unsupported("index has unmerged entries")
+                if extended & 0x2000:
+                    raise Unsupported("index has intent-to-add entries")
+                end = data.index(b"\0", name_at)
+                entries[data[name_at:end]] = [fields[:10], fields[10], flags, extended]
+                pos += (end - pos + 8) & ~7
+            while pos < len(data) - 20:
+                signature = data[pos:pos + 4]
+                if not b"A" <= signature[:1] <= b"Z":
+                    raise Unsupported(f"index extension {signature!r}")
+                pos += 8 + struct.unpack(">I", data[pos + 4:pos + 8])[0]
+        self._index, self._index_stamp = entries, stamp
+        return entries
+
+    def _write_index(self, lock, entries):
+        # Optional extensions (cache tree, untracked cache) are dropped; git
+        # rebuilds them when it next needs them.
+        version = 3 if any(e[3] for e in entries.values()) else 2
+        parts = [struct.pack(">4sII", b"DIRC", version, len(entries))]
+        for path in sorted(entries):
+            fields, sha, flags, extended = entries[path]
+            entry = struct.pack(">10I20sH", *fields, sha, flags)
+            if extended:
+                entry += struct.pack(">H", extended)
+            entry += path
+            parts.append(entry + b"\0" * (8 - len(entry) % 8))
+        data = b"".join(parts)
+        lock.write(data + hashlib.sha1(data).digest())
+        lock.close()
+
+    def _key(self, rel_path):
+        return (self.prefix + rel_path.replace(os.sep, "/")).encode("utf-8")
+
+    def _stage(self, entries, paths):
+        """Bring the index entries for ``paths`` in line with the working tree
+        (``git add -A -- paths``)."""
+        for rel_path in paths:
+            key = self._key(rel_path)
+            full = os.path.join(self.work_tree, *key.decode("utf-8").split("/"))
+            try:
+                st = os.lstat(full)
+            except FileNotFoundError:
+                entries.pop(key, None)
+                continue
+            old = entries.get(key)
+            if stat.S_ISLNK(st.st_mode):
+                mode, data = 0o120000, os.readlink(full).encode("utf-8")
+            elif stat.S_ISREG(st.st_mode):
+                if self.filemode:
+                    mode = 0o100755 if st.st_mode & 0o100 else 0o100644
+                else:
+                    mode = old[0][6] if old else 0o100644
+                with open(full, "rb") as f:
+                    data = f.read()
+            else:
+                raise Unsupported(f"{rel_path} is not a file")
+            sha = bytes.fromhex(self.write_object("blob", data))
+            fields = (int(st.st_ctime) & 0xFFFFFFFF, st.st_ctime_ns % 10**9,
+                      int(st.st_mtime) & 0xFFFFFFFF, st.st_mtime_ns % 10**9,
+                      st.st_dev & 0xFFFFFFFF, st.st_ino & 0xFFFFFFFF, mode,
+                      st.st_uid & 0xFFFFFFFF, st.st_gid & 0xFFFFFFFF, st.st_size & 0xFFFFFFFF)
+            extended = old[3] if old else 0
+            flags = (old[2] & 0x8000 if old else 0) | (0x4000 if extended else 0)
+            entries[key] = [fields, sha, flags | min(len(key), 0xFFF), extended]
+
+    def _read_tree(self, commit):
+        """``{path: (mode, sha)}`` of every file in ``commit``'s tree."""
+        if self._tree[0] != commit:
+            flat = {}
+            if commit is not None:
+                _, data = self.read_object(commit)
+                self._flatten(data[5:45].decode("ascii"), b"", flat)
+            self._tree = (commit, flat)
+        return self._tree[1]
+
+    def _flatten(self, tree, prefix, flat):
+        _, data = self.read_object(tree)
+        pos = 0
+        while pos < len(data):
+            space = data.index(b" ", pos)
+            nul = data.index(b"\0", space)
+            mode, name, sha = int(data[pos:space], 8), data[space + 1:nul], data[nul + 1:nul + 21]
+            if mode == 0o40000:
+                self._flatten(sha.hex(), prefix + name + b"/", flat)
+            else:
+                flat[prefix + name] = (mode, sha)
+            pos = nul + 21
+
+    def _write_tree(self, flat):
+        root = {}
+        for path, (mode, sha) in flat.items():
+            *dirs, name = path.split(b"/")
+            node = root
+            for part in dirs:
+                node = node.setdefault(part, {})
+            node[name] = (mode, sha)
+        return self._write_subtree(root)
+
+    def _write_subtree(self, node):
+        items = []
+        for name, value in node.items():
+            if isinstance(value, dict):
+                sha = bytes.fromhex(self._write_subtree(value))
+                items.append((name + b"/", b"40000 " + name, sha))
+            else:
+                items.append((name, b"%o " % value[0] + name, value[1]))
+        items.sort()
+        return self.write_object("tree", b"".join(label + b"\0" + sha
+                                                  for _, label, sha in items))
+
+    # ── Commit ─────────────────────────────────────────────────────────
+    def commit(self, message, paths, date, author_date=None):
+        """Stage ``paths`` and commit them on top of HEAD, dated ``date`` (and
+        ``author_date``, if given) in git's ``<epoch> <offset>`` form.
+
+        Like ``git commit -- paths``, the tree is HEAD's with only ``paths``
+        updated; anything else already staged stays staged, uncommitted.
+        Returns the new commit id, or None when the tree did not change.
+        """
+        self._check_hooks()
+        author, committer = self.identity("AUTHOR"), self.identity("COMMITTER")
+        ref, parent = self.head()
+        lock = os.fdopen(self._lock(self.index_path), "wb")
+        try:
+            entries = self._load_index()
+            self._check_attributes(entries, paths)
+            self._stage(entries, paths)
+            flat = dict(self._read_tree(parent))
+            for rel_path in paths:
+                key = self._key(rel_path)
+                if key in entries:
+                    flat[key] = (entries[key][0][6], entries[key][1])
+                else:
+                    flat.pop(key, None)
+            tree = self._write_tree(flat)
+            if parent and self.read_object(parent)[1][5:45].decode("ascii") == tree:
+                lock.close()
+                os.unlink(self.index_path + ".lock")
+                self._index = None  # staged in memory but never written
+                return None
+            message = _clean_message(message)
+            header = [f"tree {tree}"] + ([f"parent {parent}"] if parent else [])
+            header += [f"author {author} {author_date or date}",
+                       f"committer {committer} {date}"]
+            sha = self.write_object("commit", ("\n".join(header) + "\n\n" + message)
+                                    .encode("utf-8"))
+            self._write_index(lock, entries)
+            reason = "commit" if parent else "commit (initial)"
+            self._update_ref(ref or "HEAD", parent, sha,
+                             f"{parent or ZERO_SHA} {sha} {committer} {date}\t"
+                             f"{reason}: {message.splitlines()[0]}\n")
+            os.replace(self.index_path + ".lock", self.index_path)
+        except BaseException:
+            lock.close()
+            self._index = None
+            if os.path.exists(self.index_path + ".lock"):
+                os.unlink(self.index_path + ".lock")
+            raise
+        self._index_stamp = self._index_stat()
+        self._tree = (sha, flat)
+        self._commits += 1
+        if self._commits % GC_EVERY == 0:
+            subprocess.run(["git", "gc", "--auto", "--quiet"], cwd=self.work_tree,
+                           capture_output=True)
+        return sha
@@ -0,0 +1,342 @@
+"""
+FriendZone Auto-Builder desktop window (tkinter).
+"""
+
+import collections
+import logging
+import logging.handlers
+import os
+import threading
+import time
+import tkinter as tk
+from tkinter import ttk, messagebox, scrolledtext
+from datetime import datetime
+
+from . import core
+from .core import (CATCH_UP_POLICIES, Schedule, catch_up, commit_step, discover, read_step,
+                   read_step_meta, recover, wait_until, write_step)
+from .steps import STEPS
+
+LOG_LINES = 500          # lines kept in the log widget
+LOG_FLUSH_MS = 250       # how often queued log lines are drawn
+LOG_FILE_BYTES = 1 << 20  # full log is rotated to .build_log, .build_log.1, ...
+LOG_FILE_BACKUPS = 3
+
+
+# ── GUI App ────────────────────────────────────────────────────────────────
+class FriendZoneBuilder:
+    def __init__(self):
+        self.root = tk.Tk()
+        self.root.title("FriendZone Auto-Builder")
+        self.root.geometry("620x560")
+        self.root.resizable(False, False)
+        self.root.configure(bg="#1e1e2e")
+
+        self.running = False
+        self.thread = None
+        self.stop_event = threading.Event()
+
+        # Log lines are queued from any thread and drawn in batches on a timer.
+        self._log_queue = collections.deque(maxlen=LOG_LINES)
+        self._file_log = logging.getLogger("fzbuilder.gui")
+        self._file_log.propagate = False
+        if not self._file_log.handlers:
+            handler = logging.handlers.RotatingFileHandler(
+                os.path.join(core.REPO_DIR, ".build_log"), maxBytes=LOG_FILE_BYTES,
+                backupCount=LOG_FILE_BACKUPS, encoding="utf-8", delay=True)
+            handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+            self._file_log.addHandler(handler)
+            self._file_log.setLevel(logging.INFO)
+
+        self._build_ui()
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
+
+    # ── UI layout ──────────────────────────────────────────────────────
+    def _build_ui(self):
+        # Header
+        header = tk.Frame(self.root, bg="#4a90d9", height=60)
+        header.pack(fill="x")
+        header.pack_propagate(False)
+        tk.Label(
+            header, text="FriendZone Auto-Builder",
+            font=("Segoe UI", 18, "bold"), fg="white", bg="#4a90d9",
+        ).pack(expand=True)
+
+        # Body
+        body = tk.Frame(self.root, bg="#1e1e2e", padx=20, pady=12)
+        body.pack(fill="both", expand=True)
+
+        # Status row
+        status_frame = tk.Frame(body, bg="#1e1e2e")
+        status_frame.pack(fill="x", pady=(0, 8))
+        tk.Label(status_frame, text="Status:", fg="#aaa", bg="#1e1e2e",
+                 font=("Segoe UI", 11)).pack(side="left")
+        self.status_var = tk.StringVar(value="Stopped")
+        self.status_label = tk.Label(
+            status_frame, textvariable=self.status_var,
+            fg="#e74c3c", bg="#1e1e2e", font=("Segoe UI", 11, "bold"),
+        )
+        self.status_label.pack(side="left", padx=(6, 0))
+
+        # Step info
+        step_frame = tk.Frame(body, bg="#1e1e2e")
+        step_frame.pack(fill="x", pady=(0, 8))
+        tk.Label(step_frame, text="Current step:", fg="#aaa", bg="#1e1e2e",
+                 font=("Segoe UI", 11)).pack(side="left")
+        self.step_var = tk.StringVar(value=f"{read_step()} / {len(STEPS)}+")
+        tk.Label(step_frame, textvariable=self.step_var, fg="white",
+                 bg="#1e1e2e", font=("Segoe UI", 11)).pack(side="left", padx=(6, 0))
+
+        # Progress bar
+        self.progress = ttk.Progressbar(body, length=560, mode="determinate",
+                                        maximum=max(len(STEPS), 1))
+        self.progress.pack(pady=(0, 8))
+        self.progress["value"] = min(read_step(), len(STEPS))
+
+        # Settings row 1: Schedule
+        row1 = tk.Frame(body, bg="#1e1e2e")
+        row1.pack(fill="x", pady=(0, 6))
+        tk.Label(row1, text="Schedule:", fg="#aaa",
+                 bg="#1e1e2e", font=("Segoe UI", 11)).pack(side="left")
+        self.interval_var = tk.StringVar(value="5")
+        tk.Entry(
+            row1, textvariable=self.interval_var, width=14,
+            font=("Segoe UI", 11), bg="#2a2a3e", fg="white",
+            insertbackground="white", relief="flat",
+        ).pack(side="left", padx=(6, 0))
+        tk.Label(row1, text="jitter:", fg="#aaa",
+                 bg="#1e1e2e", font=("Segoe UI", 11)).pack(side="left", padx=(12, 0))
+        self.jitter_var = tk.StringVar(value="0")
+        tk.Entry(
+            row1, textvariable=self.jitter_var, width=4,
+            font=("Segoe UI", 11), bg="#2a2a3e", fg="white",
+            insertbackground="white", relief="flat",
+        ).pack(side="left", padx=(6, 0))
+        tk.Label(row1, text="minutes, or a cron expression", fg="#666",
+                 bg="#1e1e2e", font=("Segoe UI", 9)).pack(side="left", padx=(8, 0))
+
+        # Settings row 2: Max commits
+        row2 = tk.Frame(body, bg="#1e1e2e")
+        row2.pack(fill="x", pady=(0, 6))
+        tk.Label(row2, text="Max commits:", fg="#aaa",
+                 bg="#1e1e2e", font=("Segoe UI", 11)).pack(side="left")
+        self.max_commits_var = tk.StringVar(value="5")
+        tk.Entry(
+            row2, textvariable=self.max_commits_var, width=5,
+            font=("Segoe UI", 11), bg="#2a2a3e", fg="white",
+            insertbackground="white", relief="flat",
+        ).pack(side="left", padx=(6, 0))
+        tk.Label(row2, text="then auto-stop  (0 = unlimited)", fg="#666",
+                 bg="#1e1e2e", font=("Segoe UI", 9)).pack(side="left", padx=(8, 0))
+
+        # Settings row 3: Catch-up after downtime
+        row3 = tk.Frame(body, bg="#1e1e2e")
+        row3.pack(fill="x", pady=(0, 6))
+        tk.Label(row3, text="Missed runs:", fg="#aaa",
+                 bg="#1e1e2e", font=("Segoe UI", 11)).pack(side="left")
+        self.catch_up_var = tk.StringVar(value="skip")
+        catch_up_menu = tk.OptionMenu(row3, self.catch_up_var, *CATCH_UP_POLICIES)
+        catch_up_menu.configure(font=("Segoe UI", 10), bg="#2a2a3e", fg="white",
+                                activebackground="#3a3a4e", relief="flat",
+                                highlightthickness=0)
+        catch_up_menu.pack(side="left", padx=(6, 0))
+        self.backdate_var = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            row3, text="backdate author dates", variable=self.backdate_var,
+            fg="#aaa", bg="#1e1e2e", selectcolor="#2a2a3e",
+            activebackground="#1e1e2e", font=("Segoe UI", 9),
+        ).pack(side="left", padx=(8, 0))
+
+        # Buttons
+        btn_frame = tk.Frame(body, bg="#1e1e2e")
+        btn_frame.pack(pady=12)
+
+        self.start_btn = tk.Button(
+            btn_frame, text="  START  ", font=("Segoe UI", 13, "bold"),
+            bg="#27ae60", fg="white", activebackground="#219a52",
+            relief="flat", padx=24, pady=8, cursor="hand2",
+            command=self.start,
+        )
+        self.start_btn.pack(side="left", padx=8)
+
+        self.stop_btn = tk.Button(
+            btn_frame, text="  STOP  ", font=("Segoe UI", 13, "bold"),
+            bg="#e74c3c", fg="white", activebackground="#c0392b",
+            relief="flat", padx=24, pady=8, cursor="hand2",
+            command=self.stop, state="disabled",
+        )
+        self.stop_btn.pack(side="left", padx=8)
+
+        # Log area
+        tk.Label(body, text="Log:", fg="#aaa", bg="#1e1e2e",
+                 font=("Segoe UI", 10), anchor="w").pack(fill="x")
+        self.log = scrolledtext.ScrolledText(
+            body, height=8, bg="#12121a", fg="#ccc",
+            font=("Consolas", 10), relief="flat", state="disabled",
+            insertbackground="white",
+        )
+        self.log.pack(fill="both", expand=True, pady=(2, 0))
+
+        # Handle window close
+        self.root.protocol("WM_DELETE_CLOSE", self.on_close)
+
+    # ── Logging ────────────────────────────────────────────────────────
+    def _log(self, msg):
+        """Queue a log line; safe to call from the worker thread."""
+        timestamp = datetime.now().strftime("%H:%M:%S")
+        self._log_queue.append(f"[{timestamp}] {msg}\n")
+        self._file_log.info(msg)
+
+    def _drain_log(self):
+        lines = []
+        while self._log_queue:
+            lines.append(self._log_queue.popleft())
+        if lines:
+            self.log.configure(state="normal")
+            self.log.insert("end", "".join(lines))
+            excess = int(self.log.index("end-1c").split(".")[0]) - 1 - LOG_LINES
+            if excess > 0:
+                self.log.delete("1.0", f"{excess + 1}.0")
+            self.log.see("end")
+            self.log.configure(state="disabled")
+        self.root.after(LOG_FLUSH_MS, self._drain_log)
+
+    # ── Start / Stop ───────────────────────────────────────────────────
+    def start(self):
+        # Validate git repo
+        if discover(core.REPO_DIR) is None:
+            messagebox.showerror("Error", "No git repository found in:\n" + core.REPO_DIR +
+                                 "\n\nPlease run 'git init' first.")
+            return
+
+        try:
+            jitter_min = int(self.jitter_var.get())
+            if jitter_min < 0:
+                raise ValueError
+            schedule = Schedule.parse(self.interval_var.get(), jitter=jitter_min * 60)
+        except ValueError:
+            messagebox.showerror("Error", "Schedule must be a positive number of minutes or a "
+                                          "5-field cron expression; jitter must be 0 or more.")
+            return
+
+        try:
+            max_commits = int(self.max_commits_var.get())
+            if max_commits < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Max commits must be 0 or a positive integer.")
+            return
+
+        self.running = True
+        self.stop_event.clear()
+        self.start_btn.configure(state="disabled")
+        self.stop_btn.configure(state="normal")
+        if max_commits > 0:
+            self.status_var.set(f"Running (0/{max_commits} commits)")
+        else:
+            self.status_var.set("Running (unlimited)")
+        self.status_label.configure(fg="#27ae60")
+        self._log(f"Started! {max_commits} commits, {schedule.describe()}." if max_commits > 0
+                  else f"Started! Unlimited commits, {schedule.describe()}.")
+
+        self.thread = threading.Thread(
+            target=self._run_loop,
+            args=(schedule, max_commits, self.catch_up_var.get(), self.backdate_var.get()),
+            daemon=True,
+        )
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.running = False
+        self.start_btn.configure(state="normal")
+        self.stop_btn.configure(state="disabled")
+        self.status_var.set("Stopped")
+        self.status_label.configure(fg="#e74c3c")
+        self._log("Stopped by user.")
+
+    # ── Main loop (runs in background thread) ─────────────────────────
+    def _run_loop(self, schedule, max_commits=0, catch_up_policy="skip", backdate=False):
+        try:
+            self._run(schedule, max_commits, catch_up_policy, backdate)
+        except Exception as e:  # a dead worker must not leave the UI showing "Running"
+            self._log(f"Stopped on error: {e}")
+            self.root.after(0, self._reset_ui)
+
+    def _run(self, schedule, max_commits, catch_up_policy, backdate):
+        commits_done = 0
+
+        # Runs missed while the builder was offline are handled in one batch.
+        caught_up = catch_up(schedule, catch_up_policy, backdate, log=self._log)
+        if caught_up:
+            self._log(f"Caught up with {caught_up} commit(s).")
+            self.root.after(0, lambda s=read_step(): self.step_var.set(f"{s} / {len(STEPS)}+"))
+
+        # A deadline persisted by a previous session still applies after a restart.
+        try:
+            next_run = float(read_step_meta()["next_run_at"])
+        except (KeyError, ValueError):
+            next_run = None
+        if next_run is not None and next_run > time.time():
+            self._log(f"Resuming schedule; next commit at {datetime.fromtimestamp(next_run):%H:%M}.")
+            if wait_until(next_run, self.stop_event):
+                return
+
+        while not self.stop_event.is_set():
+            recover(log=self._log)
+            step_num = read_step()
+            self.root.after(0, lambda s=step_num: self.step_var.set(f"{s} / {len(STEPS)}+"))
+            self.root.after(0, lambda s=step_num: self.progress.configure(value=min(s, len(STEPS))))
+
+            # Execute the step
+            if step_num < len(STEPS):
+                self._log(f"Running step {step_num}...")
+            # Render and commit (no commit when the step changed nothing)
+            step_num, msg, success = commit_step(log=self._log)
+            new_step = step_num + 1
+            next_run = schedule.next_after(time.time())
+            write_step(new_step, next_run_at=f"{next_run:.0f}")
+            commits_done += 1
+
+            if success:
+                self._log(f"Committed: {msg}")
+            else:
+                self._log("Nothing new to commit (no changes).")
+
+            self.root.after(0, lambda s=new_step: self.step_var.set(f"{s} / {len(STEPS)}+"))
+            self.root.after(0, lambda s=new_step: self.progress.configure(value=min(s, len(STEPS))))
+
+            # Update status with commit count
+            if max_commits > 0:
+                self.root.after(0, lambda c=commits_done, m=max_commits:
+                                self.status_var.set(f"Running ({c}/{m} commits)"))
+
+            # Check if we've hit the max
+            if max_commits > 0 and commits_done >= max_commits:
+                self._log(f"Done! {commits_done} commits completed. Auto-stopped.")
+                self.root.after(0, self._reset_ui)
+                return
+
+            # Wait for the next scheduled run
+            remaining_commits = f" ({commits_done}/{max_commits})" if max_commits > 0 else ""
+            self._log(f"Next commit{remaining_commits} at "
+                      f"{datetime.fromtimestamp(next_run):%H:%M}. Waiting...")
+
+            if wait_until(next_run, self.stop_event):
+                return
+
+    def _reset_ui(self):
+        self.running = False
+        self.stop_event.set()
+        self.start_btn.configure(state="normal")
+        self.stop_btn.configure(state="disabled")
+        self.status_var.set("Stopped")
+        self.status_label.configure(fg="#e74c3c")
+
+    # ── Cleanup ────────────────────────────────────────────────────────
+    def on_close(self):
+        self.stop_event.set()
+        self.root.destroy()
+
+    def run(self):
+        self.root.mainloop()
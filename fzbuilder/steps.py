@@ -0,0 +1,443 @@
+"""
+FriendZone Auto-Builder steps: the feature steps (STEPS) followed by the
+rotating maintenance cycles (MAINTENANCE_CYCLES).
+
+The file bodies live in ``fzbuilder/templates/<step>/<path>.tmpl`` and are
+read through ``template()`` only when their step runs.
+"""
+
+import re
+from datetime import datetime
+
+from .core import template, write_file, append_file, write_block
+
+
+# Each step returns a commit message
+STEPS = []
+
+
+def step(fn):
+    STEPS.append(fn)
+    return fn
+
+
+# ── STEP 0: Scaffold ──────────────────────────────────────────────────────
+@step
+def step_0():
+    write_file("index.html", template("step_0/index.html"))
+    write_file("css/style.css", template("step_0/css/style.css"))
+    write_file("js/app.js", template("step_0/js/app.js"))
+    write_file("README.md", template("step_0/README.md"))
+    return "Initial project setup with HTML, CSS, JS scaffold"
+
+
+# ── STEP 1: Auth module ───────────────────────────────────────────────────
+@step
+def step_1():
+    write_file("js/auth.js", template("step_1/js/auth.js"))
+    append_file("css/style.css", template("step_1/css/style.css"))
+    return "Add authentication module with login and signup forms"
+
+
+# ── STEP 2: Feed ──────────────────────────────────────────────────────────
+@step
+def step_2():
+    write_file("js/feed.js", template("step_2/js/feed.js"))
+    append_file("css/style.css", template("step_2/css/style.css"))
+    return "Add news feed with post creation, likes, and time display"
+
+
+# ── STEP 3: Profile ───────────────────────────────────────────────────────
+@step
+def step_3():
+    write_file("js/profile.js", template("step_3/js/profile.js"))
+    append_file("css/style.css", template("step_3/css/style.css"))
+    return "Add user profile page with stats, bio, and edit functionality"
+
+
+# ── STEP 4: Friends ───────────────────────────────────────────────────────
+@step
+def step_4():
+    write_file("js/friends.js", template("step_4/js/friends.js"))
+    append_file("css/style.css", template("step_4/css/style.css"))
+    return "Add friends system with requests, accept/decline, and friends list"
+
+
+# ── STEP 5: Comments ──────────────────────────────────────────────────────
+@step
+def step_5():
+    write_file("js/comments.js", template("step_5/js/comments.js"))
+    append_file("css/style.css", template("step_5/css/style.css"))
+    return "Add commenting system with add, delete, and display"
+
+
+# ── STEP 6: Messaging ─────────────────────────────────────────────────────
+@step
+def step_6():
+    write_file("js/messaging.js", template("step_6/js/messaging.js"))
+    append_file("css/style.css", template("step_6/css/style.css"))
+    return "Add direct messaging with inbox, threads, and unread badges"
+
+
+# ── STEP 7: Notifications ─────────────────────────────────────────────────
+@step
+def step_7():
+    write_file("js/notifications.js", template("step_7/js/notifications.js"))
+    append_file("css/style.css", template("step_7/css/style.css"))
+    return "Add notification system with types, icons, and unread tracking"
+
+
+# ── STEP 8: Search ─────────────────────────────────────────────────────────
+@step
+def step_8():
+    write_file("js/search.js", template("step_8/js/search.js"))
+    append_file("css/style.css", template("step_8/css/style.css"))
+    return "Add search functionality for users and posts"
+
+
+# ── STEP 9: Wire up app.js ────────────────────────────────────────────────
+@step
+def step_9():
+    write_file("js/app.js", template("step_9/js/app.js"))
+    write_file("index.html", template("step_9/index.html"))
+    append_file("css/style.css", template("step_9/css/style.css"))
+    return "Wire up all modules in main app controller and update HTML"
+
+
+# ── STEP 10: Settings ─────────────────────────────────────────────────────
+@step
+def step_10():
+    write_file("js/settings.js", template("step_10/js/settings.js"))
+    append_file("css/style.css", template("step_10/css/style.css"))
+    return "Add settings page with privacy, notification, and account options"
+
+
+# ── STEP 11: Dark mode ────────────────────────────────────────────────────
+@step
+def step_11():
+    write_file("js/theme.js", template("step_11/js/theme.js"))
+    append_file("css/style.css", template("step_11/css/style.css"))
+    return "Add dark mode theme toggle with full CSS support"
+
+
+# ── STEP 12: Media & emoji ────────────────────────────────────────────────
+@step
+def step_12():
+    write_file("js/media.js", template("step_12/js/media.js"))
+    append_file("css/style.css", template("step_12/css/style.css"))
+    return "Add image upload support and emoji picker component"
+
+
+# ── STEP 13: Responsive ───────────────────────────────────────────────────
+@step
+def step_13():
+    append_file("css/style.css", template("step_13/css/style.css"))
+    return "Add responsive design with mobile breakpoints"
+
+
+# ── STEP 14: Backend models ───────────────────────────────────────────────
+@step
+def step_14():
+    write_file("backend/requirements.txt", template("step_14/backend/requirements.txt"))
+    write_file("backend/app.py", template("step_14/backend/app.py"))
+    write_file("backend/models.py", template("step_14/backend/models.py"))
+    write_file("backend/migrate.py", template("step_14/backend/migrate.py"))
+    write_file("backend/recount.py", template("step_14/backend/recount.py"))
+    return "Add Flask backend with SQLAlchemy models for all entities"
+
+
+# ── STEP 15: Auth routes ──────────────────────────────────────────────────
+@step
+def step_15():
+    write_file("backend/routes_auth.py", template("step_15/backend/routes_auth.py"))
+    return "Add backend authentication routes with JWT support"
+
+
+# ── STEP 16: Post routes ──────────────────────────────────────────────────
+@step
+def step_16():
+    write_file("backend/routes_posts.py", template("step_16/backend/routes_posts.py"))
+    write_file("backend/timeline.py", template("step_16/backend/timeline.py"))
+    return "Add backend post routes with CRUD, likes, and comments"
+
+
+# ── STEP 17: Config files ─────────────────────────────────────────────────
+@step
+def step_17():
+    write_file(".gitignore", template("step_17/.gitignore"))
+    write_file("package.json", template("step_17/package.json"))
+    return "Add .gitignore, package.json, and project configuration"
+
+
+# ── STEP 18: UI utilities ─────────────────────────────────────────────────
+@step
+def step_18():
+    write_file("js/ui.js", template("step_18/js/ui.js"))
+    append_file("css/style.css", template("step_18/css/style.css"))
+    return "Add UI utilities: loading spinner, toast notifications"
+
+
+# ── STEP 19: Online status tracker ────────────────────────────────────────
+@step
+def step_19():
+    write_file("js/status.js", template("step_19/js/status.js"))
+    append_file("css/style.css", template("step_19/css/style.css"))
+    return "Add online status tracker with heartbeat and last seen"
+
+
+# ── STEP 20: Stories/Status updates ───────────────────────────────────────
+@step
+def step_20():
+    write_file("js/stories.js", template("step_20/js/stories.js"))
+    append_file("css/style.css", template("step_20/css/style.css"))
+    return "Add stories feature with 24h expiry, viewer tracking, and color picker"
+
+
+# ── STEP 21: Hashtag system ───────────────────────────────────────────────
+@step
+def step_21():
+    write_file("js/hashtags.js", template("step_21/js/hashtags.js"))
+    append_file("css/style.css", template("step_21/css/style.css"))
+    return "Add hashtag system with extraction, indexing, and trending topics"
+
+
+# ── STEP 22: Bookmarks / Saved Posts ──────────────────────────────────────
+@step
+def step_22():
+    write_file("js/bookmarks.js", template("step_22/js/bookmarks.js"))
+    append_file("css/style.css", template("step_22/css/style.css"))
+    return "Add bookmarks system for saving and organizing posts"
+
+
+# ── STEP 23: Report & Block users ─────────────────────────────────────────
+@step
+def step_23():
+    write_file("js/moderation.js", template("step_23/js/moderation.js"))
+    append_file("css/style.css", template("step_23/css/style.css"))
+    return "Add content reporting and user blocking system"
+
+
+# ── STEP 24: Activity log ─────────────────────────────────────────────────
+@step
+def step_24():
+    write_file("js/activity.js", template("step_24/js/activity.js"))
+    append_file("css/style.css", template("step_24/css/style.css"))
+    return "Add activity log with timeline view and weekly summary"
+
+
+# ── STEP 25: Groups feature ───────────────────────────────────────────────
+@step
+def step_25():
+    write_file("js/groups.js", template("step_25/js/groups.js"))
+    append_file("css/style.css", template("step_25/css/style.css"))
+    return "Add groups feature with create, join, leave, and group posts"
+
+
+# ── STEP 26: Events feature ───────────────────────────────────────────────
+@step
+def step_26():
+    write_file("js/events.js", template("step_26/js/events.js"))
+    append_file("css/style.css", template("step_26/css/style.css"))
+    return "Add events feature with create, attend, and event calendar cards"
+
+
+# ── STEP 27: Polls in posts ───────────────────────────────────────────────
+@step
+def step_27():
+    write_file("js/polls.js", template("step_27/js/polls.js"))
+    append_file("css/style.css", template("step_27/css/style.css"))
+    return "Add polls feature with voting, results bar, and expiration"
+
+
+# ── STEP 28: Share / Repost ───────────────────────────────────────────────
+@step
+def step_28():
+    write_file("js/share.js", template("step_28/js/share.js"))
+    append_file("css/style.css", template("step_28/css/style.css"))
+    return "Add share and repost functionality with share counts"
+
+
+# ── STEP 29: Admin dashboard ──────────────────────────────────────────────
+@step
+def step_29():
+    write_file("js/admin.js", template("step_29/js/admin.js"))
+    append_file("css/style.css", template("step_29/css/style.css"))
+    return "Add admin dashboard with stats, reports, and user management"
+
+
+# ── STEP 30: Backend friends routes ───────────────────────────────────────
+@step
+def step_30():
+    write_file("backend/routes_friends.py", template("step_30/backend/routes_friends.py"))
+    return "Add backend friend request routes with accept and decline"
+
+
+# ── STEP 31: Backend messaging routes ─────────────────────────────────────
+@step
+def step_31():
+    write_file("backend/routes_messages.py", template("step_31/backend/routes_messages.py"))
+    write_file("backend/conversations.py", template("step_31/backend/conversations.py"))
+    return "Add backend messaging routes with threads and read receipts"
+
+
+# ── STEP 32: Backend search & user routes ─────────────────────────────────
+@step
+def step_32():
+    write_file("backend/routes_search.py", template("step_32/backend/routes_search.py"))
+    return "Add backend search and user profile routes"
+
+
+# ── STEP 33: Frontend API service ─────────────────────────────────────────
+@step
+def step_33():
+    write_file("js/api.js", template("step_33/js/api.js"))
+    return "Add frontend API service layer with auth, posts, friends, and messaging"
+
+
+# ── STEP 34: Error handling middleware ─────────────────────────────────────
+@step
+def step_34():
+    write_file("backend/middleware.py", template("step_34/backend/middleware.py"))
+    return "Add backend error handling middleware with rate limiter and logging"
+
+
+# ── STEP 35: Backend config and CORS ──────────────────────────────────────
+@step
+def step_35():
+    write_file("backend/config.py", template("step_35/backend/config.py"))
+    return "Add backend configuration classes for dev, prod, and testing"
+
+
+# ── STEP 36: Password validation and utils ────────────────────────────────
+@step
+def step_36():
+    write_file("js/validation.js", template("step_36/js/validation.js"))
+    append_file("css/style.css", template("step_36/css/style.css"))
+    return "Add form validation utilities with error display"
+
+
+# ── STEP 37: Accessibility improvements ───────────────────────────────────
+@step
+def step_37():
+    write_file("js/accessibility.js", template("step_37/js/accessibility.js"))
+    append_file("css/style.css", template("step_37/css/style.css"))
+    return "Add accessibility features: keyboard nav, skip links, ARIA live regions"
+
+
+# ── STEP 38: PWA manifest and service worker ──────────────────────────────
+@step
+def step_38():
+    write_file("manifest.json", template("step_38/manifest.json"))
+    write_file("sw.js", template("step_38/sw.js"))
+    return "Add PWA manifest and service worker for offline support"
+
+
+# ── STEP 39: Backend tests ────────────────────────────────────────────────
+@step
+def step_39():
+    write_file("backend/tests/__init__.py", "")
+    write_file("backend/tests/test_auth.py", template("step_39/backend/tests/test_auth.py"))
+    write_file("backend/tests/test_posts.py", template("step_39/backend/tests/test_posts.py"))
+    write_file("backend/tests/test_indexes.py", template("step_39/backend/tests/test_indexes.py"))
+    write_file("backend/tests/test_timeline.py", template("step_39/backend/tests/test_timeline.py"))
+    write_file("backend/tests/test_messages.py", template("step_39/backend/tests/test_messages.py"))
+    return "Add backend unit tests for authentication and post endpoints"
+
+
+# ── STEP 40: Infinite scroll & lazy loading ───────────────────────────────
+@step
+def step_40():
+    write_file("js/infinite_scroll.js", template("step_40/js/infinite_scroll.js"))
+    append_file("css/style.css", template("step_40/css/style.css"))
+    return "Add infinite scroll pagination and lazy image loading"
+
+
+# ── STEP 41: Date/time utilities ──────────────────────────────────────────
+@step
+def step_41():
+    write_file("js/datetime.js", template("step_41/js/datetime.js"))
+    return "Add comprehensive date/time utility functions"
+
+
+# ── STEP 42: Local storage manager ────────────────────────────────────────
+@step
+def step_42():
+    write_file("js/storage.js", template("step_42/js/storage.js"))
+    return "Add local storage manager with cleanup, export, and import"
+
+
+# ── Maintenance cycles (rotate after all feature steps) ───────────────────
+def _maint_add_analytics(version):
+    write_file("js/analytics.js", template("maint/add_analytics/js/analytics.js", version=version))
+    return "Add analytics tracking module v" + str(version)
+
+
+def _maint_add_perf_monitor(version):
+    write_file("js/performance.js",
+               template("maint/add_perf_monitor/js/performance.js", version=version))
+    return "Add performance monitoring module v" + str(version)
+
+
+def _maint_update_css_animations(version):
+    css = template("maint/update_css_animations/css/style.css", version=version)
+    write_block("css/style.css", "animations", css, legacy=(
+        r'\n/\* Animation utilities v\d+ \*/\n'
+        r'.*?\n\[data-theme="dark"\] \.skeleton \{[^\n]*\n'))
+    return "Add CSS animation utilities and skeleton loading v" + str(version)
+
+
+def _maint_add_keyboard_shortcuts(version):
+    write_file("js/shortcuts.js",
+               template("maint/add_keyboard_shortcuts/js/shortcuts.js", version=version))
+    css = template("maint/add_keyboard_shortcuts/css/style.css")
+    write_block("css/style.css", "shortcuts", css, legacy=re.escape(css))
+    return "Add keyboard shortcuts with help overlay v" + str(version)
+
+
+def _maint_add_export_data(version):
+    write_file("js/data_export.js",
+               template("maint/add_export_data/js/data_export.js", version=version))
+    return "Add data export module with JSON and CSV download v" + str(version)
+
+
+def _maint_refactor_feed_rendering(version):
+    ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    body = template("maint/refactor_feed_rendering/js/feed.js", ts=ts, version=version)
+    write_block("js/feed.js", "feed-rendering", body, legacy=(
+        r"\n// Feed rendering optimizations - v\d+ \([^)]*\)\n"
+        r"Feed\.renderPostBatch = .*?\nFeed\.virtualScroll = \{.*?\n\};\n"))
+    return "Optimize feed rendering with batching and virtual scroll v" + str(version)
+
+
+def _maint_add_error_boundary(version):
+    write_file("js/error_boundary.js",
+               template("maint/add_error_boundary/js/error_boundary.js", version=version))
+    css = template("maint/add_error_boundary/css/style.css")
+    write_block("css/style.css", "error-page", css, legacy=re.escape(css))
+    return "Add error boundary with global error capture v" + str(version)
+
+
+def _maint_add_link_preview(version):
+    write_file("js/link_preview.js",
+               template("maint/add_link_preview/js/link_preview.js", version=version))
+    css = template("maint/add_link_preview/css/style.css")
+    write_block("css/style.css", "link-preview", css, legacy=re.escape(css))
+    return "Add link preview detection and rendering v" + str(version)
+
+
+def _maint_update_readme(version):
+    write_file("README.md", template("maint/update_readme/README.md", version=version))
+    return "Update README with full feature list v" + str(version)
+
+
+MAINTENANCE_CYCLES = [
+    _maint_add_analytics,
+    _maint_add_perf_monitor,
+    _maint_update_css_animations,
+    _maint_add_keyboard_shortcuts,
+    _maint_add_export_data,
+    _maint_refactor_feed_rendering,
+    _maint_add_error_boundary,
+    _maint_add_link_preview,
+    _maint_update_readme,
+]
@@ -0,0 +1,29 @@
+"""optimize_css must not move declarations past rules that override them."""
+
+import unittest
+
+from fzbuilder.assets import minify_css
+
+
+class MergeAcrossShorthandsTest(unittest.TestCase):
+    def assertUnmerged(self, css):
+        self.assertEqual(minify_css(css), css)
+
+    def test_font_is_not_moved_past_line_height(self):
+        self.assertUnmerged(".a{font:12px serif}.b{line-height:2}.a{color:red}")
+
+    def test_shorthands_with_differently_named_longhands(self):
+        self.assertUnmerged(".a{gap:1px}.b{row-gap:2px}.a{color:red}")
+        self.assertUnmerged(".a{border-radius:1px}.b{border-top-left-radius:2px}.a{color:red}")
+        self.assertUnmerged(".a{inset:0}.b{top:1px}.a{color:red}")
+        self.assertUnmerged(".a{place-items:center}.b{align-items:start}.a{color:red}")
+        self.assertUnmerged(".a{grid-gap:1px}.b{gap:2px}.a{color:red}")
+        self.assertUnmerged(".a{margin-left:1px}.b{margin-inline-start:2px}.a{color:red}")
+
+    def test_unrelated_rules_still_merge(self):
+        self.assertEqual(minify_css(".a{font:12px serif}.b{color:blue}.a{color:red}"),
+                         ".b{color:blue}.a{font:12px serif;color:red}")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""GitRepo commits only the paths it is given, like ``git commit -- paths``."""
+
+import os
+import subprocess
+import tempfile
+import unittest
+
+from fzbuilder.gitrepo import GitRepo, Unsupported
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True,
+                          text=True).stdout.strip()
+
+
+class CommitPathsTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="fzgit-")
+        self.path = self._tmp.name
+        git(self.path, "init", "-q")
+        git(self.path, "config", "user.name", "FriendZone Test")
+        git(self.path, "config", "user.email", "test@friendzone.local")
+        self.write("base.txt", "base\n")
+        self.write("old/gone.txt", "bye\n")
+        git(self.path, "add", "-A")
+        git(self.path, "commit", "-q", "-m", "base")
+        self.repo = GitRepo(self.path)
+
+    def tearDown(self):
+        self.repo.close()
+        self._tmp.cleanup()
+
+    def write(self, rel_path, text):
+        full = os.path.join(self.path, rel_path)
+        os.makedirs(os.path.dirname(full), exist_ok=True)
+        with open(full, "w") as f:
+            f.write(text)
+
+    def test_unrelated_staged_file_is_not_committed(self):
+        self.write("other.txt", "staged by the user\n")
+        git(self.path, "add", "other.txt")
+        self.write("step.txt", "step\n")
+        self.repo.commit("step", ["step.txt"], "1700000000 +0000")
+
+        self.assertEqual(git(self.path, "show", "--name-only", "--format=", "HEAD"), "step.txt")
+        self.assertEqual(git(self.path, "ls-tree", "-r", "--name-only", "HEAD").split(),
+                         ["base.txt", "old/gone.txt", "step.txt"])
+        self.assertEqual(git(self.path, "diff", "--cached", "--name-only"), "other.txt")
+        git(self.path, "fsck", "--strict")
+
+    def test_removed_path_is_dropped_from_the_tree(self):
+        os.remove(os.path.join(self.path, "old/gone.txt"))
+        self.write("base.txt", "changed\n")
+        self.repo.commit("step", ["old/gone.txt", "base.txt"], "1700000000 +0000")
+        self.repo.commit("noop", ["base.txt"], "1700000001 +0000")
+
+        self.assertEqual(git(self.path, "ls-tree", "-r", "--name-only", "HEAD"), "base.txt")
+        self.assertEqual(git(self.path, "rev-list", "--count", "HEAD"), "2")
+        self.assertEqual(git(self.path, "status", "--porcelain"), "")
+
+    def test_unchanged_tree_keeps_the_users_staged_content(self):
+        self.write("base.txt", "staged by the user\n")
+        git(self.path, "add", "base.txt")
+        self.write("base.txt", "base\n")
+        self.assertIsNone(self.repo.commit("noop", ["base.txt"], "1700000000 +0000"))
+        self.write("step.txt", "step\n")
+        self.repo.commit("step", ["step.txt"], "1700000001 +0000")
+
+        self.assertEqual(git(self.path, "show", ":base.txt"), "staged by the user")
+        self.assertEqual(git(self.path, "show", "--name-only", "--format=", "HEAD"), "step.txt")
+
+    def test_attribute_files_are_unsupported(self):
+        self.write("sub/.gitattributes", "*.txt text eol=crlf\n")
+        self.assertRaises(Unsupported, GitRepo, self.path)
+
+        # Added after the repository was opened, above a path being committed
+        self.write("sub/step.txt", "step\n")
+        self.assertRaises(Unsupported, self.repo.commit, "step", ["sub/step.txt"],
+                          "1700000000 +0000")
+
+        # Only in the index
+        git(self.path, "add", "sub/.gitattributes")
+        os.remove(os.path.join(self.path, "sub/.gitattributes"))
+        self.assertRaises(Unsupported, self.repo.commit, "step", ["base.txt"],
+                          "1700000000 +0000")
+        self.assertEqual(git(self.path, "rev-list", "--count", "HEAD"), "1")
+
+
+if __name__ == "__main__":
+    unittest.main()
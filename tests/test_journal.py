@@ -0,0 +1,143 @@
+"""recover() finishes a step interrupted between its journal records."""
+
+import json
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest import mock
+
+from fzbuilder import core
+
+
+def git(cwd, *args):
+    return subprocess.run(["git", *args], cwd=cwd, check=True, capture_output=True,
+                          text=True).stdout.strip()
+
+
+class Crash(Exception):
+    pass
+
+
+def fake_step(step_num):
+    # Appending makes the output depend on what is on disk, like the real steps.
+    core._touched.clear()
+    core.append_file("log.txt", f"step {step_num}\n")
+    core.write_file(f"step{step_num}.txt", f"rendered by step {step_num}\n")
+    return f"Step {step_num}"
+
+
+class RecoverTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="fzjournal-")
+        self.path = self._tmp.name
+        git(self.path, "init", "-q")
+        git(self.path, "config", "user.name", "FriendZone Test")
+        git(self.path, "config", "user.email", "test@friendzone.local")
+        with open(os.path.join(self.path, "log.txt"), "w") as f:
+            f.write("base\n")
+        git(self.path, "add", "-A")
+        git(self.path, "commit", "-q", "-m", "base")
+        self.base = git(self.path, "rev-parse", "HEAD")
+        self._previous = core.REPO_DIR
+        core.set_repo(self.path)
+        patcher = mock.patch.object(core, "run_step", fake_step)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.logged = []
+
+    def tearDown(self):
+        core.set_repo(self._previous)
+        self._tmp.cleanup()
+
+    def read(self, rel_path):
+        with open(os.path.join(self.path, rel_path)) as f:
+            return f.read()
+
+    def ops(self):
+        with open(core.JOURNAL_FILE) as f:
+            return [json.loads(line)["op"] for line in f]
+
+    def assertCommitted(self):
+        """HEAD is one "Step 0" commit on top of base, holding what step 0 rendered."""
+        self.assertEqual(git(self.path, "rev-list", "--count", "HEAD"), "2")
+        self.assertEqual(git(self.path, "log", "-1", "--format=%s"), "Step 0")
+        self.assertEqual(git(self.path, "show", "HEAD:log.txt"), "base\nstep 0")
+        self.assertEqual(git(self.path, "show", "HEAD:step0.txt"), "rendered by step 0")
+        self.assertEqual(self.read("log.txt"), "base\nstep 0\n")
+        self.assertEqual(git(self.path, "status", "--porcelain", "--", "log.txt", "step0.txt"), "")
+        self.assertEqual(self.ops()[-2:], ["begin", "commit"])
+        self.assertEqual(core.read_step(), 1)
+
+    def test_step_commits_between_begin_and_commit_records(self):
+        self.assertEqual(core.commit_step(log=self.logged.append), (0, "Step 0", True))
+        self.assertCommitted()
+        with open(core.JOURNAL_FILE) as f:
+            begin = json.loads(f.readline())
+        self.assertEqual(begin["parent"], self.base)
+        self.assertFalse(core.recover(log=self.logged.append))
+
+    def test_crash_after_begin_record(self):
+        with mock.patch.object(core.Overlay, "flush", side_effect=Crash):
+            self.assertRaises(Crash, core.commit_step, log=self.logged.append)
+        self.assertEqual(self.ops(), ["begin"])
+        self.assertEqual(self.read("log.txt"), "base\n")
+
+        self.assertTrue(core.recover(log=self.logged.append))
+        self.assertCommitted()
+
+    def test_crash_mid_flush(self):
+        def flush_one_then_crash(overlay):
+            core._write_disk("log.txt", overlay.files["log.txt"])
+            raise Crash
+
+        with mock.patch.object(core.Overlay, "flush", flush_one_then_crash):
+            self.assertRaises(Crash, core.commit_step, log=self.logged.append)
+        self.assertEqual(self.read("log.txt"), "base\nstep 0\n")
+        self.assertFalse(os.path.exists(os.path.join(self.path, "step0.txt")))
+
+        # log.txt already holds its new content; it must not get "step 0" twice
+        self.assertTrue(core.recover(log=self.logged.append))
+        self.assertCommitted()
+
+    def test_crash_after_commit(self):
+        real_commit = core.git_commit
+
+        def commit_then_crash(*args, **kwargs):
+            real_commit(*args, **kwargs)
+            raise Crash
+
+        with mock.patch.object(core, "git_commit", commit_then_crash):
+            self.assertRaises(Crash, core.commit_step, log=self.logged.append)
+        self.assertEqual(self.ops(), ["begin"])
+        self.assertEqual(core.read_step(), 0)
+
+        with mock.patch.object(core, "render_range", side_effect=AssertionError("re-rendered")):
+            self.assertTrue(core.recover(log=self.logged.append))
+        self.assertCommitted()
+        self.assertIn("had already landed", self.logged[-1])
+
+    def test_render_that_differs_aborts_the_step(self):
+        with mock.patch.object(core.Overlay, "flush", side_effect=Crash):
+            self.assertRaises(Crash, core.commit_step, log=self.logged.append)
+
+        def other_step(step_num):
+            core._touched.clear()
+            core.write_file("step0.txt", "something else\n")
+            return "Step 0"
+
+        with mock.patch.object(core, "run_step", other_step):
+            self.assertTrue(core.recover(log=self.logged.append))
+        self.assertEqual(self.ops(), ["begin", "abort"])
+        self.assertEqual(git(self.path, "rev-parse", "HEAD"), self.base)
+        self.assertEqual(self.read("log.txt"), "base\n")
+        self.assertFalse(os.path.exists(os.path.join(self.path, "step0.txt")))
+        self.assertEqual(core.read_step(), 0)
+
+        # The aborted step simply runs again
+        self.assertEqual(core.commit_step(log=self.logged.append), (0, "Step 0", True))
+        self.assertCommitted()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,48 @@
+"""Schedule parses intervals and five-field cron expressions and finds the next run."""
+
+import unittest
+from datetime import datetime
+
+from fzbuilder.core import Schedule
+
+
+def at(*args):
+    return datetime(*args).timestamp()
+
+
+class ScheduleTest(unittest.TestCase):
+    def assertNext(self, spec, after, expected):
+        self.assertEqual(datetime.fromtimestamp(Schedule.parse(spec).next_after(at(*after))),
+                         datetime(*expected))
+
+    def test_interval_in_minutes(self):
+        self.assertEqual(Schedule.parse("5").next_after(1000, jitter=False), 1300)
+
+    def test_jitter_is_bounded(self):
+        schedule = Schedule.parse("1", jitter=30)
+        for _ in range(20):
+            self.assertTrue(1060 <= schedule.next_after(1000) <= 1090)
+        self.assertEqual(schedule.next_after(1000, jitter=False), 1060)
+
+    def test_cron_next_fire_times(self):
+        # Strictly after: a run due now is not due again until the next match
+        self.assertNext("*/15 * * * *", (2024, 3, 15, 10, 0), (2024, 3, 15, 10, 15))
+        self.assertNext("30 9 * * 1-5", (2024, 3, 15, 10, 0), (2024, 3, 18, 9, 30))
+        self.assertNext("0 12 * * 7", (2024, 3, 18, 0, 0), (2024, 3, 24, 12, 0))
+        self.assertNext("0 0 1 */3 *", (2024, 5, 20, 0, 0), (2024, 7, 1, 0, 0))
+        self.assertNext("0 0 29 2 *", (2025, 1, 1, 0, 0), (2028, 2, 29, 0, 0))
+
+    def test_restricted_day_of_month_or_day_of_week(self):
+        # Like cron, either field may match when both are restricted
+        self.assertNext("0 0 13 * 5", (2024, 1, 1, 0, 0), (2024, 1, 5, 0, 0))
+        self.assertNext("0 0 13 * 5", (2024, 1, 12, 0, 0), (2024, 1, 13, 0, 0))
+
+    def test_invalid_specs_are_rejected(self):
+        for spec in ("0", "* * * *", "60 * * * *", "*/0 * * * *", "5-1 * * * *",
+                     "x * * * *", "0 0 31 2 *", "0 0 30 2 *"):
+            with self.subTest(spec=spec):
+                self.assertRaises(ValueError, Schedule.parse, spec)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""write_block keeps one marked copy of a block however often a step re-runs."""
+
+import os
+import tempfile
+import unittest
+
+from fzbuilder import core
+
+
+class WriteBlockTest(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory(prefix="fzblock-")
+        self._previous = core.REPO_DIR
+        core.set_repo(self._tmp.name)
+
+    def tearDown(self):
+        core.set_repo(self._previous)
+        self._tmp.cleanup()
+
+    def write(self, rel_path, text):
+        with open(os.path.join(self._tmp.name, rel_path), "w") as f:
+            f.write(text)
+
+    def read(self, rel_path):
+        with open(os.path.join(self._tmp.name, rel_path)) as f:
+            return f.read()
+
+    def test_first_write_appends_after_a_blank_line(self):
+        self.write("style.css", "body{margin:0}\n")
+        self.assertTrue(core.write_block("style.css", "cards", ".card{padding:1px}"))
+        self.assertEqual(self.read("style.css"),
+                         "body{margin:0}\n\n/* fz:begin cards */\n.card{padding:1px}\n"
+                         "/* fz:end cards */\n")
+
+    def test_block_is_replaced_in_place(self):
+        self.write("app.js", "// fz:begin a\nold();\n// fz:end a\nafter();\n")
+        core.write_block("app.js", "a", "new();")
+        self.assertEqual(self.read("app.js"), "// fz:begin a\nnew();\n// fz:end a\nafter();\n")
+        self.assertFalse(core.write_block("app.js", "a", "new();"))
+        self.assertEqual(self.read("app.js"), "// fz:begin a\nnew();\n// fz:end a\nafter();\n")
+
+    def test_blocks_are_independent(self):
+        core.write_block("index.html", "a", "<p>a</p>")
+        core.write_block("index.html", "b", "<p>b</p>")
+        core.write_block("index.html", "a", "<p>A</p>")
+        self.assertEqual(self.read("index.html"),
+                         "<!-- fz:begin a -->\n<p>A</p>\n<!-- fz:end a -->\n\n"
+                         "<!-- fz:begin b -->\n<p>b</p>\n<!-- fz:end b -->\n")
+
+    def test_legacy_copies_are_stripped(self):
+        self.write("style.css", ".x{}\n.dup{color:red}\n.y{}\n.dup{color:red}\n")
+        core.write_block("style.css", "dup", ".dup{color:red}", legacy=r"\.dup\{color:red\}\n")
+        self.assertEqual(self.read("style.css"),
+                         ".x{}\n.y{}\n\n/* fz:begin dup */\n.dup{color:red}\n/* fz:end dup */\n")
+
+
+if __name__ == "__main__":
+    unittest.main()